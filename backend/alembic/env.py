@@ -42,7 +42,13 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection):
-    context.configure(connection=connection, target_metadata=target_metadata)
+    # Single (default) schema only: keeps autogenerate on SQLAlchemy 2.0's
+    # batched get_multi_* reflection path instead of inspecting each schema.
+    context.configure(
+        connection=connection,
+        target_metadata=target_metadata,
+        include_schemas=False,
+    )
     with context.begin_transaction():
         context.run_migrations()
 
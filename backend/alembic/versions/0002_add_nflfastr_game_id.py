@@ -19,7 +19,16 @@ depends_on: Union[str, Sequence[str], None] = None
 
 def upgrade() -> None:
     op.add_column("games", sa.Column("nflfastr_game_id", sa.String(), nullable=True))
-    op.create_index("ix_games_nflfastr_game_id", "games", ["nflfastr_game_id"])
+    # CONCURRENTLY avoids blocking reads/writes on games while the index
+    # builds; it can't run inside a transaction.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_games_nflfastr_game_id",
+            "games",
+            ["nflfastr_game_id"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
 
     # Back-fill the one seeded sample game
     op.execute(
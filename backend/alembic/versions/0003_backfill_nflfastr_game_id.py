@@ -9,8 +9,11 @@ Create Date: 2026-02-19 00:00:00.000000
 """
 from __future__ import annotations
 
+import uuid
 from typing import Sequence, Union
 
+import sqlalchemy as sa
+
 from alembic import op
 
 revision: str = "0003"
@@ -18,19 +21,44 @@ down_revision: Union[str, None] = "0002"
 branch_labels: Union[str, Sequence[str], None] = None
 depends_on: Union[str, Sequence[str], None] = None
 
+# Rows updated per committed page
+BATCH_SIZE = 5000
+
 
 def upgrade() -> None:
-    op.execute("""
-        UPDATE games
-        SET nflfastr_game_id = CONCAT(
-            season, '_',
-            LPAD(week::text, 2, '0'), '_',
-            (SELECT abbr FROM teams WHERE teams.id = games.away_team_id), '_',
-            (SELECT abbr FROM teams WHERE teams.id = games.home_team_id)
-        )
-        WHERE nflfastr_game_id IS NULL
+    # Set-based join instead of two correlated subqueries per row, so the
+    # planner can hash-join teams once rather than probing it per game.
+    # Keyset-paginated by id; each page commits on its own so a large games
+    # table never holds one long-running transaction.
+    page = sa.text("""
+        UPDATE games g
+        SET nflfastr_game_id = g.season || '_' ||
+            LPAD(g.week::text, 2, '0') || '_' ||
+            ta.abbr || '_' ||
+            th.abbr
+        FROM teams ta, teams th
+        WHERE ta.id = g.away_team_id
+          AND th.id = g.home_team_id
+          AND g.id IN (
+              SELECT id FROM games
+              WHERE nflfastr_game_id IS NULL AND id > :last_id
+              ORDER BY id
+              LIMIT :batch_size
+          )
+        RETURNING g.id
     """)
 
+    last_id = uuid.UUID(int=0)
+    with op.get_context().autocommit_block():
+        bind = op.get_bind()
+        while True:
+            ids = bind.execute(
+                page, {"last_id": last_id, "batch_size": BATCH_SIZE}
+            ).scalars().all()
+            if not ids:
+                break
+            last_id = max(ids)
+
 
 def downgrade() -> None:
     # Can't safely undo a back-fill; leave as-is
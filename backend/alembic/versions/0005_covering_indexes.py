@@ -0,0 +1,56 @@
+"""covering indexes for per-game play and wp-history reads
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Built CONCURRENTLY (outside a transaction) so live plays/wp_predictions
+    # traffic isn't blocked during the build.
+    with op.get_context().autocommit_block():
+        # Every per-game read is WHERE game_id = ? ORDER BY sequence
+        op.create_index(
+            "ix_plays_game_seq",
+            "plays",
+            ["game_id", "sequence"],
+            postgresql_include=[
+                "play_number", "quarter", "game_clock_seconds",
+                "down", "yards_to_go", "posteam_abbr", "play_type",
+            ],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index("ix_plays_game_id", table_name="plays", postgresql_concurrently=True)
+
+        op.create_index(
+            "ix_wp_predictions_play_wp",
+            "wp_predictions",
+            ["play_id"],
+            postgresql_include=["home_wp", "away_wp"],
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.drop_index(
+            "ix_wp_predictions_play_id",
+            table_name="wp_predictions",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_wp_predictions_play_id", "wp_predictions", ["play_id"])
+    op.drop_index("ix_wp_predictions_play_wp", table_name="wp_predictions")
+    op.create_index("ix_plays_game_id", "plays", ["game_id"])
+    op.drop_index("ix_plays_game_seq", table_name="plays")
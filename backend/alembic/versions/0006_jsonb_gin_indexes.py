@@ -0,0 +1,46 @@
+"""GIN indexes on play_raw.payload and game_state_snapshots.situation
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # jsonb_path_ops only supports @>, but is much smaller than jsonb_ops
+    # and containment is the only operator used against these columns.
+    # Built CONCURRENTLY so ingest into these tables isn't blocked.
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_play_raw_payload_gin",
+            "play_raw",
+            ["payload"],
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+        op.create_index(
+            "ix_game_state_snapshots_situation_gin",
+            "game_state_snapshots",
+            ["situation"],
+            postgresql_using="gin",
+            postgresql_ops={"situation": "jsonb_path_ops"},
+            postgresql_concurrently=True,
+            if_not_exists=True,
+        )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_game_state_snapshots_situation_gin", table_name="game_state_snapshots")
+    op.drop_index("ix_play_raw_payload_gin", table_name="play_raw")
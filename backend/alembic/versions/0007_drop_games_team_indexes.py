@@ -0,0 +1,30 @@
+"""drop single-column team indexes on games
+
+Nothing queries games by home/away team alone; the indexes only add write
+cost on import. Team filters always come with a season filter, which is
+served by ix_games_season.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_games_home_team_id", table_name="games")
+    op.drop_index("ix_games_away_team_id", table_name="games")
+
+
+def downgrade() -> None:
+    op.create_index("ix_games_away_team_id", "games", ["away_team_id"])
+    op.create_index("ix_games_home_team_id", "games", ["home_team_id"])
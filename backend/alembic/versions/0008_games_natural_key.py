@@ -0,0 +1,31 @@
+"""unique (season, week, home_team_id, away_team_id) on games
+
+Lets import_season dedupe with INSERT ... ON CONFLICT DO NOTHING instead of
+pre-loading every existing game for the season.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_unique_constraint(
+        "uq_games_season_week_teams",
+        "games",
+        ["season", "week", "home_team_id", "away_team_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint("uq_games_season_week_teams", "games", type_="unique")
@@ -0,0 +1,27 @@
+"""drop ix_games_season in favour of the natural-key unique index
+
+uq_games_season_week_teams leads with season, so it already serves every
+season (and season + week) lookup; the single-column index is redundant.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.drop_index("ix_games_season", table_name="games")
+
+
+def downgrade() -> None:
+    op.create_index("ix_games_season", "games", ["season"])
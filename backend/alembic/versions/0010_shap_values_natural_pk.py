@@ -0,0 +1,56 @@
+"""key shap_values on (wp_prediction_id, feature_name) and drop the UUID id
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The SHAP worker could previously re-write features the replay already
+    # stored for the same prediction; keep one row per (prediction, feature).
+    op.execute(
+        """
+        DELETE FROM shap_values a
+        USING shap_values b
+        WHERE a.wp_prediction_id = b.wp_prediction_id
+          AND a.feature_name = b.feature_name
+          AND a.id < b.id
+        """
+    )
+    op.drop_constraint("shap_values_pkey", "shap_values", type_="primary")
+    op.drop_column("shap_values", "id")
+    op.create_primary_key("shap_values_pkey", "shap_values", ["wp_prediction_id", "feature_name"])
+    # The PK leads with wp_prediction_id, so the FK index is redundant
+    op.drop_index("ix_shap_values_wp_prediction_id", table_name="shap_values")
+
+
+def downgrade() -> None:
+    op.create_index(
+        "ix_shap_values_wp_prediction_id", "shap_values", ["wp_prediction_id"]
+    )
+    op.drop_constraint("shap_values_pkey", "shap_values", type_="primary")
+    op.add_column(
+        "shap_values",
+        sa.Column(
+            "id",
+            postgresql.UUID(as_uuid=True),
+            nullable=False,
+            server_default=sa.text("gen_random_uuid()"),
+        ),
+    )
+    op.alter_column("shap_values", "id", server_default=None)
+    op.create_primary_key("shap_values_pkey", "shap_values", ["id"])
@@ -0,0 +1,31 @@
+"""store win probabilities and SHAP values as REAL (float4)
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Each ALTER rewrites the table (and its indexes) under an exclusive lock
+    op.alter_column("wp_predictions", "home_wp", type_=sa.REAL(), existing_nullable=False)
+    op.alter_column("wp_predictions", "away_wp", type_=sa.REAL(), existing_nullable=False)
+    op.alter_column("shap_values", "shap_value", type_=sa.REAL(), existing_nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column("shap_values", "shap_value", type_=sa.Float(), existing_nullable=False)
+    op.alter_column("wp_predictions", "away_wp", type_=sa.Float(), existing_nullable=False)
+    op.alter_column("wp_predictions", "home_wp", type_=sa.Float(), existing_nullable=False)
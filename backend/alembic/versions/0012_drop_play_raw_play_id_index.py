@@ -0,0 +1,27 @@
+"""drop ix_play_raw_play_id (duplicates the play_id unique constraint)
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_play_raw_play_id", table_name="play_raw", postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    op.create_index("ix_play_raw_play_id", "play_raw", ["play_id"])
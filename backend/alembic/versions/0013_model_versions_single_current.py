@@ -0,0 +1,47 @@
+"""partial unique index: at most one current model version
+
+Replaces the plain btree on the is_current boolean.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-15 00:00:00.000000
+"""
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep only the newest current version flagged before enforcing uniqueness
+    op.execute(
+        """
+        UPDATE model_versions SET is_current = false
+        WHERE is_current
+          AND id <> (
+              SELECT id FROM model_versions WHERE is_current
+              ORDER BY created_at DESC LIMIT 1
+          )
+        """
+    )
+    op.create_index(
+        "uq_model_versions_current",
+        "model_versions",
+        ["is_current"],
+        unique=True,
+        postgresql_where=sa.text("is_current"),
+    )
+    op.drop_index("ix_model_versions_is_current", table_name="model_versions")
+
+
+def downgrade() -> None:
+    op.create_index("ix_model_versions_is_current", "model_versions", ["is_current"])
+    op.drop_index("uq_model_versions_current", table_name="model_versions")
@@ -3,21 +3,39 @@ from __future__ import annotations
 from datetime import date
 from uuid import UUID
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, Query, Response
+from pydantic import TypeAdapter
 
 from app.deps import DbSession
 from app.schemas.analytics import (
     ClutchResponse,
     DecisionGradesResponse,
+    GameAnalyticsResponse,
     MomentumSwingsResponse,
 )
 from app.schemas.game import GameDetail, GameRead
 from app.schemas.play import PlayRead, PlayWpRead
-from app.services.analytics_service import get_clutch_index, get_decision_grades, get_momentum_swings
+from app.services.analytics_service import (
+    get_clutch_index,
+    get_decision_grades,
+    get_game_analytics,
+    get_momentum_swings,
+)
 from app.services.game_service import GameService
 
 router = APIRouter(tags=["games"])
 
+# List endpoints serialise straight to JSON bytes in pydantic-core instead of
+# going through FastAPI's per-item response_model re-validation.
+# response_model is kept on the routes for the OpenAPI schema.
+_GameListAdapter = TypeAdapter(list[GameRead])
+_PlayListAdapter = TypeAdapter(list[PlayRead])
+_PlayWpListAdapter = TypeAdapter(list[PlayWpRead])
+
+
+def _json_response(adapter: TypeAdapter, items: list) -> Response:
+    return Response(content=adapter.dump_json(items), media_type="application/json")
+
 
 @router.get("/games", response_model=list[GameRead])
 async def list_games(
@@ -27,10 +45,10 @@ async def list_games(
     season: int | None = Query(None, description="Filter by season year (e.g. 2025)"),
     week: int | None = Query(None, description="Filter by week number (1-18 for regular season)"),
     playoffs: bool = Query(False, description="If true, return only playoff games (week >= 19)"),
-) -> list[GameRead]:
+) -> Response:
     svc = GameService(db)
     games = await svc.list_games(game_date=game_date, status=status, season=season, week=week, playoffs=playoffs)
-    return games
+    return _json_response(_GameListAdapter, games)
 
 
 @router.get("/games/{game_id}", response_model=GameDetail)
@@ -40,17 +58,17 @@ async def get_game(game_id: UUID, db: DbSession) -> GameDetail:
 
 
 @router.get("/games/{game_id}/plays", response_model=list[PlayRead])
-async def list_plays(game_id: UUID, db: DbSession) -> list[PlayRead]:
+async def list_plays(game_id: UUID, db: DbSession) -> Response:
     svc = GameService(db)
-    return await svc.list_plays(game_id)
+    return _json_response(_PlayListAdapter, await svc.list_plays(game_id))
 
 
 @router.get("/games/{game_id}/wp-history", response_model=list[PlayWpRead])
-async def wp_history(game_id: UUID, db: DbSession) -> list[PlayWpRead]:
+async def wp_history(game_id: UUID, db: DbSession) -> Response:
     """Return all plays for a game with their win-probability and SHAP data.
     Used to seed the WpChart when opening the game detail page after a replay."""
     svc = GameService(db)
-    return await svc.list_plays_with_wp(game_id)
+    return _json_response(_PlayWpListAdapter, await svc.list_plays_with_wp(game_id))
 
 
 @router.get("/games/{game_id}/momentum-swings", response_model=MomentumSwingsResponse)
@@ -70,15 +88,7 @@ async def clutch_index(
     top: int = Query(5, ge=1, le=20, description="Number of top clutch plays to return"),
 ) -> ClutchResponse:
     """Return clutch play rankings and team totals for a game."""
-    svc = GameService(db)
-    game = await svc.get_game(game_id)
-    return await get_clutch_index(
-        db,
-        game_id,
-        home_abbr=game.home_team.abbr,
-        away_abbr=game.away_team.abbr,
-        top_plays=top,
-    )
+    return await get_clutch_index(db, game_id, top_plays=top)
 
 
 @router.get("/games/{game_id}/decision-grades", response_model=DecisionGradesResponse)
@@ -89,3 +99,18 @@ async def decision_grades(
 ) -> DecisionGradesResponse:
     """Grade coaching decisions on 4th downs using counterfactual win probability."""
     return await get_decision_grades(db, game_id, top=top)
+
+
+@router.get("/games/{game_id}/analytics", response_model=GameAnalyticsResponse)
+async def game_analytics(
+    game_id: UUID,
+    db: DbSession,
+    swings: int = Query(3, ge=1, le=10, description="Number of top swings to return"),
+    clutch: int = Query(5, ge=1, le=20, description="Number of top clutch plays to return"),
+    grades: int = Query(10, ge=1, le=50, description="Number of top decisions to return"),
+) -> GameAnalyticsResponse:
+    """Momentum swings, clutch index and decision grades in one response,
+    computed from a single load of the game's plays."""
+    return await get_game_analytics(
+        db, game_id, top_swings=swings, top_clutch=clutch, top_decisions=grades
+    )
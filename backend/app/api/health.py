@@ -1,31 +1,64 @@
 from __future__ import annotations
 
+import asyncio
+import time
+
+import redis.asyncio as aioredis
 from fastapi import APIRouter
 from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.deps import DbSession, RedisDep
 
 router = APIRouter(tags=["health"])
 
+# Probe results are reused for this many seconds so frequent orchestrator
+# polling doesn't take a pool connection per hit.
+HEALTH_CACHE_TTL = 1.0
 
-@router.get("/health")
-async def health_check(db: DbSession, redis: RedisDep) -> dict:
-    # Check database
+_cache: tuple[float, dict] | None = None
+_lock = asyncio.Lock()
+
+
+async def _probe_db(db: AsyncSession) -> str:
     try:
         await db.execute(text("SELECT 1"))
-        db_status = "connected"
+        return "connected"
     except Exception as exc:
-        db_status = f"error: {exc}"
+        return f"error: {exc}"
+
 
-    # Check Redis
+async def _probe_redis(redis: aioredis.Redis) -> str:
     try:
         await redis.ping()
-        redis_status = "connected"
+        return "connected"
     except Exception as exc:
-        redis_status = f"error: {exc}"
+        return f"error: {exc}"
+
+
+@router.get("/health")
+async def health_check(db: DbSession, redis: RedisDep) -> dict:
+    global _cache
+
+    if _cache is not None and time.monotonic() - _cache[0] < HEALTH_CACHE_TTL:
+        return _cache[1]
+
+    async with _lock:
+        # Another request may have refreshed the cache while we waited
+        if _cache is not None and time.monotonic() - _cache[0] < HEALTH_CACHE_TTL:
+            return _cache[1]
+
+        # DB and Redis are independent, so probe them concurrently
+        async with asyncio.TaskGroup() as tg:
+            db_task = tg.create_task(_probe_db(db))
+            redis_task = tg.create_task(_probe_redis(redis))
+        db_status = db_task.result()
+        redis_status = redis_task.result()
 
-    return {
-        "status": "ok" if db_status == "connected" and redis_status == "connected" else "degraded",
-        "db": db_status,
-        "redis": redis_status,
-    }
+        result = {
+            "status": "ok" if db_status == "connected" and redis_status == "connected" else "degraded",
+            "db": db_status,
+            "redis": redis_status,
+        }
+        _cache = (time.monotonic(), result)
+        return result
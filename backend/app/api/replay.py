@@ -13,8 +13,18 @@ from app.services.shap_service import ShapService
 
 router = APIRouter(tags=["replay"])
 
-# Active replay tasks: game_id → asyncio.Task
+# Active replay tasks: game_id → asyncio.Task. Finished tasks remove
+# themselves; _replays_lock makes check-then-insert atomic per game.
 _active_replays: dict[str, asyncio.Task] = {}
+_replays_lock = asyncio.Lock()
+
+MAX_ACTIVE_REPLAYS = 1000
+
+
+def _evict(game_id: str, task: asyncio.Task) -> None:
+    # Only drop the entry if it still points at this task
+    if _active_replays.get(game_id) is task:
+        del _active_replays[game_id]
 
 
 @router.post("/replay/{game_id}/start")
@@ -24,6 +34,7 @@ async def start_replay(
     nflfastr_game_id: str = Query(..., description="The game_id string in the nflfastR CSV to replay"),
     speed: float = Query(default=1.0, ge=0.1, le=100.0, description="Plays per second"),
 ) -> dict:
+    # Cheap early reject before loading the CSV; re-checked under the lock below
     if game_id in _active_replays and not _active_replays[game_id].done():
         raise HTTPException(status_code=409, detail=f"Replay already running for game {game_id}")
 
@@ -49,8 +60,16 @@ async def start_replay(
         shap_service=ShapService(),
     )
 
-    task = asyncio.create_task(svc.run(game_id))
-    _active_replays[game_id] = task
+    async with _replays_lock:
+        existing = _active_replays.get(game_id)
+        if existing is not None and not existing.done():
+            raise HTTPException(status_code=409, detail=f"Replay already running for game {game_id}")
+        if len(_active_replays) >= MAX_ACTIVE_REPLAYS:
+            raise HTTPException(status_code=429, detail="Too many concurrent replays")
+
+        task = asyncio.create_task(svc.run(game_id))
+        task.add_done_callback(lambda t: _evict(game_id, t))
+        _active_replays[game_id] = task
 
     return {"status": "started", "game_id": game_id, "csv": csv_filename, "speed": speed}
 
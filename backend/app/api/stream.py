@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import json
 
 from fastapi import APIRouter, Request
 from fastapi.responses import StreamingResponse
@@ -11,6 +10,11 @@ from app.utils.cache import get_latest_game_event
 
 router = APIRouter(tags=["stream"])
 
+# Max events sent in one SSE frame. Frames carry a JSON array of events;
+# the cached snapshot sent on connect is a single event object. Events arrive
+# from sse_manager already JSON-encoded, so frames are assembled from bytes.
+MAX_BATCH = 32
+
 
 @router.get("/stream/games/{game_id}")
 async def stream_game(game_id: str, request: Request) -> StreamingResponse:
@@ -18,7 +22,7 @@ async def stream_game(game_id: str, request: Request) -> StreamingResponse:
         # Send cached latest event immediately so new subscribers see current state
         cached = await get_latest_game_event(game_id)
         if cached:
-            yield f"data: {cached}\n\n"
+            yield b"data: " + cached + b"\n\n"
 
         q = await sse_manager.subscribe(game_id)
         try:
@@ -27,7 +31,14 @@ async def stream_game(game_id: str, request: Request) -> StreamingResponse:
                     break
                 try:
                     event = await asyncio.wait_for(q.get(), timeout=15.0)
-                    yield f"data: {json.dumps(event)}\n\n"
+                    # Drain whatever else is already queued into the same frame
+                    batch = [event]
+                    for _ in range(MAX_BATCH - 1):
+                        try:
+                            batch.append(q.get_nowait())
+                        except asyncio.QueueEmpty:
+                            break
+                    yield b"data: [" + b", ".join(batch) + b"]\n\n"
                 except asyncio.TimeoutError:
                     # Keep-alive heartbeat
                     yield ": heartbeat\n\n"
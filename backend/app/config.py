@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-import json
+from functools import lru_cache
+
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,11 +17,17 @@ class Settings(BaseSettings):
 
     # Redis / Celery
     redis_url: str = "redis://localhost:6379/0"
+    redis_pool_size: int = 100
     celery_broker_url: str = "redis://localhost:6379/1"
     celery_result_backend: str = "redis://localhost:6379/1"
 
     # ML
     model_artifact_dir: str = "./ml/artifacts"
+    # XGBoost training device: "cpu", "cuda" or "auto" (cuda if the build has it)
+    train_device: str = "cpu"
+    # SHAP backend: "cpu" (shap.TreeExplainer) or "cuda" (XGBoost pred_contribs,
+    # which runs GPUTreeShap)
+    shap_device: str = "cpu"
 
     # Replay
     replay_speed_plays_per_sec: float = 1.0
@@ -28,17 +35,15 @@ class Settings(BaseSettings):
 
     # Security / CORS
     cors_origins: list[str] = ["http://localhost:5173", "http://localhost:3000"]
+    # Explicit lists (not "*") so preflights are plain set lookups
+    cors_methods: list[str] = ["GET", "POST"]
+    cors_headers: list[str] = ["Content-Type"]
     secret_key: str = "change-this-to-a-random-secret"
 
     # Logging
     log_level: str = "INFO"
 
 
-_settings: Settings | None = None
-
-
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    global _settings
-    if _settings is None:
-        _settings = Settings()
-    return _settings
+    return Settings()
@@ -1,5 +1,11 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
+import time
+import uuid
+
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -8,19 +14,73 @@ class Base(DeclarativeBase):
     pass
 
 
+# uuid7's random bits are sliced from one os.urandom read per pool rather
+# than a syscall per id (a replay mints three ids per play). The pool is
+# dropped in forked children so worker processes never share one.
+_RANDOM_POOL_SIZE = 4090  # 409 ids
+_random_lock = threading.Lock()
+_random_pool = b""
+_random_offset = 0
+
+
+def _reset_random_pool() -> None:
+    global _random_pool, _random_offset
+    _random_pool = b""
+    _random_offset = 0
+
+
+os.register_at_fork(after_in_child=_reset_random_pool)
+
+
+def _random_80() -> int:
+    global _random_pool, _random_offset
+    with _random_lock:
+        if _random_offset >= len(_random_pool):
+            _random_pool = os.urandom(_RANDOM_POOL_SIZE)
+            _random_offset = 0
+        chunk = _random_pool[_random_offset:_random_offset + 10]
+        _random_offset += 10
+    return int.from_bytes(chunk)
+
+
+def uuid7() -> uuid.UUID:
+    """Time-ordered UUID (RFC 9562 version 7) for primary keys.
+
+    48-bit Unix-ms timestamp followed by random bits, so new rows land on the
+    right-hand edge of the PK btree instead of a random leaf as with uuid4.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | _random_80()
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
 # Engine and session factory are created lazily via init_db()
 _engine = None
 _async_session_factory: async_sessionmaker[AsyncSession] | None = None
 
+POOL_SIZE = 10
+
 
 def init_db(database_url: str) -> None:
     global _engine, _async_session_factory
     _engine = create_async_engine(
         database_url,
         echo=False,
-        pool_pre_ping=True,
-        pool_size=10,
+        # No pre-ping (it costs a round-trip per checkout); stale connections
+        # are recycled on age and dead peers are caught by tcp_user_timeout.
+        pool_pre_ping=False,
+        pool_recycle=1800,
+        pool_size=POOL_SIZE,
         max_overflow=20,
+        connect_args={
+            # asyncpg server-side statement cache + SQLAlchemy's prepared
+            # statement cache, so repeat GameService queries skip re-planning
+            "statement_cache_size": 1024,
+            "prepared_statement_cache_size": 256,
+            "timeout": 10,
+            "server_settings": {"tcp_user_timeout": "30000"},
+        },
     )
     _async_session_factory = async_sessionmaker(
         _engine,
@@ -29,6 +89,32 @@ def init_db(database_url: str) -> None:
     )
 
 
+def ensure_db(database_url: str) -> async_sessionmaker[AsyncSession]:
+    """Return the shared session factory, calling init_db() only on first use.
+
+    For scripts (seed, import_season) that may be invoked several times in one
+    process: they share a single engine and pool instead of each building and
+    disposing their own. The caller owns disposal at the end of its run.
+    """
+    if _async_session_factory is None:
+        init_db(database_url)
+    return _async_session_factory
+
+
+async def warm_pool() -> None:
+    """Open pool_size connections up front so the first requests after
+    startup don't each pay the connect/auth handshake."""
+    engine = get_engine()
+    results = await asyncio.gather(
+        *(engine.connect() for _ in range(POOL_SIZE)), return_exceptions=True
+    )
+    conns = [r for r in results if not isinstance(r, BaseException)]
+    await asyncio.gather(*(conn.close() for conn in conns))
+    errors = [r for r in results if isinstance(r, BaseException)]
+    if errors:
+        raise errors[0]
+
+
 def get_engine():
     if _engine is None:
         raise RuntimeError("Database not initialised. Call init_db() first.")
@@ -3,9 +3,11 @@ Import all games from a nflfastR play-by-play CSV into the database.
 
 Usage:
     docker compose exec backend python -m app.db.import_season --season 2025
+    docker compose exec backend python -m app.db.import_season --season 2023 2024 2025
 
-Each game is inserted once (idempotent — skips games already present for the
-same season + week + home/away team combination). Only game metadata is stored;
+Each game is inserted once (idempotent — games are COPYed into a temp table and
+ON CONFLICT skips those already present for the same season + week + home/away
+team combination). Only game metadata is stored;
 WP replay can be run separately per game on demand.
 """
 from __future__ import annotations
@@ -13,18 +15,17 @@ from __future__ import annotations
 import argparse
 import asyncio
 import logging
-import math
-from datetime import datetime, timezone
 from pathlib import Path
-import uuid
 
 import pandas as pd
-from sqlalchemy import select, tuple_
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import get_settings
-from app.db.models.game import Game, GameStatus
+from app.db.base import ensure_db, get_engine, uuid7
+from app.db.models.game import GAME_NATURAL_KEY, GameStatus
 from app.db.models.team import Team
+from app.utils.csv_io import CSV_ENGINE, present_columns
 
 logger = logging.getLogger(__name__)
 
@@ -39,30 +40,86 @@ ABBR_MAP: dict[str, str] = {
 }
 
 
-def _normalize_abbr(abbr: str) -> str:
-    return ABBR_MAP.get(abbr, abbr)
+def _prepare_games(games_df: pd.DataFrame) -> pd.DataFrame:
+    """Vectorised per-game column cleanup (abbr mapping, casts, dates)."""
+    out = pd.DataFrame({"game_id": games_df["game_id"]})
+    out["home_abbr"] = games_df["home_team"].fillna("").astype(str).replace(ABBR_MAP)
+    out["away_abbr"] = games_df["away_team"].fillna("").astype(str).replace(ABBR_MAP)
+    out["week"] = pd.to_numeric(games_df["week"], errors="coerce").fillna(0).astype("int64")
+
+    if "result" in games_df.columns:
+        out["has_result"] = games_df["result"].notna()
+    else:
+        out["has_result"] = False
+
+    for src, dst in (("total_home_score", "home_score"), ("total_away_score", "away_score")):
+        if src in games_df.columns:
+            scores = pd.to_numeric(games_df[src], errors="coerce").astype("Int64")
+            out[dst] = scores.where(out["has_result"])
+        else:
+            out[dst] = pd.Series(pd.NA, index=games_df.index, dtype="Int64")
+
+    # naive UTC at 13:00 — column is TIMESTAMP WITHOUT TIME ZONE
+    if "game_date" in games_df.columns:
+        dates = pd.to_datetime(
+            games_df["game_date"].astype(str).str[:10], format="ISO8601", errors="coerce"
+        )
+        out["scheduled_at"] = dates + pd.Timedelta(hours=13)
+    else:
+        out["scheduled_at"] = pd.NaT
+
+    if "stadium" in games_df.columns:
+        out["venue"] = games_df["stadium"].fillna("").astype(str).str.strip()
+    else:
+        out["venue"] = ""
+
+    return out
+
+
+def _nullable(col: pd.Series) -> pd.Series:
+    """Object column of Python scalars with NA/NaT as None, ready for the driver."""
+    return col.astype(object).where(col.notna(), None)
+
+
+CSV_CHUNK_ROWS = 200_000
 
+_GAME_COLUMNS = [
+    "id", "season", "week", "home_team_id", "away_team_id", "status",
+    "scheduled_at", "final_home_score", "final_away_score", "venue",
+]
 
-def _safe_int(val) -> int | None:
-    try:
-        v = float(val)
-        return None if math.isnan(v) else int(v)
-    except (TypeError, ValueError):
-        return None
 
+def _read_last_rows(csv_path: Path, use_cols: list[str]) -> pd.DataFrame:
+    """Return the last row per game_id (the one carrying final scores).
 
-def _parse_date(val) -> datetime | None:
-    """Parse a YYYY-MM-DD string into a UTC datetime at 13:00."""
-    if not val or (isinstance(val, float) and math.isnan(val)):
-        return None
-    try:
-        d = datetime.strptime(str(val)[:10], "%Y-%m-%d")
-        return d.replace(hour=13)  # naive UTC — column is TIMESTAMP WITHOUT TIME ZONE
-    except ValueError:
-        return None
+    The C engine streams the file in chunks and keeps only each chunk's
+    per-game last rows, so peak memory is one chunk rather than the whole
+    season. pyarrow doesn't support chunked reads but is columnar and much
+    leaner, so it reads in one go.
+    """
+    # Keep game_date as text so both engines hand _prepare_games the same input
+    kwargs = dict(engine=CSV_ENGINE, usecols=use_cols, dtype={"game_date": str})
+    if CSV_ENGINE == "pyarrow":
+        return pd.read_csv(csv_path, **kwargs).groupby("game_id").last().reset_index()
 
+    parts = [
+        chunk.groupby("game_id").last()
+        for chunk in pd.read_csv(csv_path, chunksize=CSV_CHUNK_ROWS, **kwargs)
+    ]
+    return pd.concat(parts).groupby(level=0).last().rename_axis("game_id").reset_index()
 
-async def import_season(season: int) -> None:
+
+def _load_games(csv_path: Path) -> pd.DataFrame:
+    """Read the PBP CSV down to one prepared row per game (blocking)."""
+    cols = ["game_id", "home_team", "away_team", "week", "season",
+            "game_date", "total_home_score", "total_away_score", "result", "stadium"]
+    use_cols = present_columns(csv_path, cols)
+    return _prepare_games(_read_last_rows(csv_path, use_cols))
+
+
+async def import_season(
+    season: int, factory: async_sessionmaker[AsyncSession] | None = None
+) -> None:
     csv_path = DATA_DIR / f"play_by_play_{season}.csv"
     if not csv_path.exists():
         # Fall back to the mounted path inside Docker
@@ -74,87 +131,67 @@ async def import_season(season: int) -> None:
         )
 
     logger.info("Reading %s ...", csv_path)
-    cols = ["game_id", "home_team", "away_team", "week", "season",
-            "game_date", "total_home_score", "total_away_score", "result", "stadium"]
-    available_cols = pd.read_csv(csv_path, nrows=0).columns.tolist()
-    use_cols = [c for c in cols if c in available_cols]
-    df = pd.read_csv(csv_path, low_memory=False, usecols=use_cols)
-
-    # One row per game (last row has final scores)
-    games_df = df.groupby("game_id").last().reset_index()
+    # Parsing is seconds of blocking pandas work; keep it off the event loop
+    games_df = await asyncio.to_thread(_load_games, csv_path)
     logger.info("Found %d unique games for season %d", len(games_df), season)
 
-    settings = get_settings()
-    engine = create_async_engine(settings.database_url)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    if factory is None:
+        factory = ensure_db(get_settings().database_url)
 
     async with factory() as session:
-        # Load all teams into a lookup dict
-        teams_result = await session.execute(select(Team))
-        teams: dict[str, Team] = {t.abbr: t for t in teams_result.scalars().all()}
-
-        # Find already-existing games for this season to skip duplicates
-        existing_result = await session.execute(
-            select(Game.season, Game.week, Game.home_team_id, Game.away_team_id)
-            .where(Game.season == season)
+        # Load all teams and attach home/away team ids in one merge
+        teams_result = await session.execute(select(Team.abbr, Team.id))
+        teams_df = pd.DataFrame(teams_result.all(), columns=["abbr", "team_id"])
+        games_df = games_df.merge(
+            teams_df.rename(columns={"abbr": "home_abbr", "team_id": "home_team_id"}),
+            on="home_abbr", how="left",
+        ).merge(
+            teams_df.rename(columns={"abbr": "away_abbr", "team_id": "away_team_id"}),
+            on="away_abbr", how="left",
         )
-        existing_set = set(existing_result.fetchall())
 
+        unknown_teams: set[str] = set(
+            games_df.loc[games_df["home_team_id"].isna(), "home_abbr"]
+        ) | set(games_df.loc[games_df["away_team_id"].isna(), "away_abbr"])
+        games_df = games_df.dropna(subset=["home_team_id", "away_team_id"])
+        for col in ("home_score", "away_score", "scheduled_at"):
+            games_df[col] = _nullable(games_df[col])
+
+        rows = [
+            (
+                uuid7(),
+                season,
+                int(row.week),
+                row.home_team_id,
+                row.away_team_id,
+                (GameStatus.final if row.has_result else GameStatus.scheduled).value,
+                row.scheduled_at,
+                row.home_score,
+                row.away_score,
+                row.venue or None,
+            )
+            for row in games_df.itertuples(index=False)
+        ]
+
+        # Stream the candidates into a temp table with binary COPY, then let
+        # the natural-key unique constraint skip games that already exist.
         inserted = 0
-        skipped = 0
-        unknown_teams: set[str] = set()
-
-        for _, row in games_df.iterrows():
-            home_abbr = _normalize_abbr(str(row.get("home_team", "") or ""))
-            away_abbr = _normalize_abbr(str(row.get("away_team", "") or ""))
-
-            home_team = teams.get(home_abbr)
-            away_team = teams.get(away_abbr)
-
-            if home_team is None:
-                unknown_teams.add(home_abbr)
-                continue
-            if away_team is None:
-                unknown_teams.add(away_abbr)
-                continue
-
-            week = _safe_int(row.get("week")) or 0
-
-            # Skip if already in DB
-            key = (season, week, home_team.id, away_team.id)
-            if key in existing_set:
-                skipped += 1
-                continue
-
-            result_val = row.get("result")
-            has_result = result_val is not None and not (
-                isinstance(result_val, float) and math.isnan(result_val)
+        if rows:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.execute(
+                "CREATE TEMP TABLE tmp_games (LIKE games INCLUDING DEFAULTS) ON COMMIT DROP"
             )
-            status = GameStatus.final if has_result else GameStatus.scheduled
-
-            home_score = _safe_int(row.get("total_home_score")) if has_result else None
-            away_score = _safe_int(row.get("total_away_score")) if has_result else None
-            scheduled_at = _parse_date(row.get("game_date"))
-            venue = str(row.get("stadium", "") or "").strip() or None
-
-            game = Game(
-                id=uuid.uuid4(),
-                season=season,
-                week=week,
-                home_team_id=home_team.id,
-                away_team_id=away_team.id,
-                status=status,
-                scheduled_at=scheduled_at,
-                final_home_score=home_score,
-                final_away_score=away_score,
-                venue=venue,
+            await driver.copy_records_to_table("tmp_games", records=rows, columns=_GAME_COLUMNS)
+            cols = ", ".join(_GAME_COLUMNS)
+            status = await driver.execute(
+                f"INSERT INTO games ({cols}) SELECT {cols} FROM tmp_games "
+                f"ON CONFLICT ({', '.join(GAME_NATURAL_KEY)}) DO NOTHING"
             )
-            session.add(game)
-            inserted += 1
-
+            inserted = int(status.rsplit(" ", 1)[-1])  # "INSERT 0 <n>"
         await session.commit()
-
-    await engine.dispose()
+        skipped = len(rows) - inserted
 
     if unknown_teams:
         logger.warning("Skipped games with unknown team abbreviations: %s", unknown_teams)
@@ -163,9 +200,49 @@ async def import_season(season: int) -> None:
         print(f"  Unknown abbrs (add to ABBR_MAP if needed): {unknown_teams}")
 
 
+IMPORT_CONCURRENCY = 4
+
+
+async def import_many(seasons: list[int]) -> list[int]:
+    """Import several seasons concurrently over the shared pool.
+
+    Seasons are independent (distinct natural keys), so one season's CSV
+    parsing overlaps with another's COPY/INSERT round-trips. A failing season
+    is logged and doesn't stop the others; returns the seasons that failed.
+    """
+    factory = ensure_db(get_settings().database_url)
+    sem = asyncio.Semaphore(IMPORT_CONCURRENCY)
+
+    async def one(season: int) -> None:
+        async with sem:
+            await import_season(season, factory)
+
+    # Every season runs to completion before returning, so the caller's
+    # engine dispose never lands mid-COPY
+    results = await asyncio.gather(*(one(s) for s in seasons), return_exceptions=True)
+    failed = []
+    for season, result in zip(seasons, results):
+        if isinstance(result, BaseException):
+            logger.error("Season %d import failed", season, exc_info=result)
+            failed.append(season)
+    return failed
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO)
     parser = argparse.ArgumentParser(description="Import NFL season games into the database")
-    parser.add_argument("--season", type=int, required=True, help="Season year (e.g. 2025)")
+    parser.add_argument(
+        "--season", type=int, nargs="+", required=True,
+        help="Season year(s) (e.g. 2025, or 2016 2017 2018)",
+    )
     args = parser.parse_args()
-    asyncio.run(import_season(args.season))
+
+    async def _main() -> list[int]:
+        try:
+            return await import_many(args.season)
+        finally:
+            await get_engine().dispose()
+
+    failed = asyncio.run(_main())
+    if failed:
+        raise SystemExit(f"Import failed for season(s): {', '.join(map(str, failed))}")
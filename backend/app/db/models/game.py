@@ -4,10 +4,10 @@ import enum
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Enum as SAEnum, ForeignKey, func
+from sqlalchemy import Enum as SAEnum, ForeignKey, UniqueConstraint, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class GameStatus(str, enum.Enum):
@@ -16,14 +16,21 @@ class GameStatus(str, enum.Enum):
     final = "final"
 
 
+# One game per season/week/matchup; used as the ON CONFLICT target on import
+GAME_NATURAL_KEY = ["season", "week", "home_team_id", "away_team_id"]
+
+
 class Game(Base):
     __tablename__ = "games"
+    __table_args__ = (
+        UniqueConstraint(*GAME_NATURAL_KEY, name="uq_games_season_week_teams"),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    season: Mapped[int] = mapped_column(index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    season: Mapped[int]
     week: Mapped[int]
-    home_team_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teams.id"), index=True)
-    away_team_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teams.id"), index=True)
+    home_team_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teams.id"))
+    away_team_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("teams.id"))
     status: Mapped[GameStatus] = mapped_column(
         SAEnum(GameStatus, name="gamestatus"),
         default=GameStatus.scheduled,
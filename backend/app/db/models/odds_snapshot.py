@@ -6,13 +6,13 @@ from datetime import datetime
 from sqlalchemy import Float, ForeignKey, func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class OddsSnapshot(Base):
     __tablename__ = "odds_snapshots"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     game_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("games.id"), index=True)
     provider: Mapped[str]
     home_ml: Mapped[float | None] = mapped_column(Float)    # moneyline
@@ -3,17 +3,29 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, Text, func
+from sqlalchemy import ForeignKey, Index, Text, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Play(Base):
     __tablename__ = "plays"
+    __table_args__ = (
+        # Covering index for the per-game "ORDER BY sequence" reads
+        Index(
+            "ix_plays_game_seq",
+            "game_id",
+            "sequence",
+            postgresql_include=[
+                "play_number", "quarter", "game_clock_seconds",
+                "down", "yards_to_go", "posteam_abbr", "play_type",
+            ],
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    game_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("games.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    game_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("games.id"))
     play_number: Mapped[int]
     sequence: Mapped[int]                     # ordering within game (for chart x-axis)
     quarter: Mapped[int]
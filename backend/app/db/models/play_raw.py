@@ -3,19 +3,27 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class PlayRaw(Base):
     __tablename__ = "play_raw"
+    __table_args__ = (
+        Index(
+            "ix_play_raw_payload_gin",
+            "payload",
+            postgresql_using="gin",
+            postgresql_ops={"payload": "jsonb_path_ops"},
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     play_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("plays.id"), unique=True, index=True
+        ForeignKey("plays.id"), unique=True
     )
     provider: Mapped[str]          # "developer_replay", "espn_live", etc.
     payload: Mapped[dict] = mapped_column(JSONB, nullable=False)
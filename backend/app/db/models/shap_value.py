@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import uuid
 
-from sqlalchemy import Float, ForeignKey
+from sqlalchemy import REAL, ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.db.base import Base
@@ -11,12 +11,12 @@ from app.db.base import Base
 class ShapValue(Base):
     __tablename__ = "shap_values"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    # Natural key: one value per feature per prediction (no surrogate id)
     wp_prediction_id: Mapped[uuid.UUID] = mapped_column(
-        ForeignKey("wp_predictions.id"), index=True
+        ForeignKey("wp_predictions.id"), primary_key=True
     )
-    feature_name: Mapped[str]
-    shap_value: Mapped[float] = mapped_column(Float)
+    feature_name: Mapped[str] = mapped_column(primary_key=True)
+    shap_value: Mapped[float] = mapped_column(REAL)
 
     wp_prediction: Mapped["WpPrediction"] = relationship(  # noqa: F821
         "WpPrediction", back_populates="shap_values"
@@ -3,17 +3,25 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import ForeignKey, func
+from sqlalchemy import ForeignKey, Index, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class GameStateSnapshot(Base):
     __tablename__ = "game_state_snapshots"
+    __table_args__ = (
+        Index(
+            "ix_game_state_snapshots_situation_gin",
+            "situation",
+            postgresql_using="gin",
+            postgresql_ops={"situation": "jsonb_path_ops"},
+        ),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     game_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("games.id"), index=True)
     snapshot_at: Mapped[datetime]
     quarter: Mapped[int]
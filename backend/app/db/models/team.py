@@ -6,13 +6,13 @@ from datetime import datetime
 from sqlalchemy import func
 from sqlalchemy.orm import Mapped, mapped_column
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class Team(Base):
     __tablename__ = "teams"
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
     abbr: Mapped[str] = mapped_column(unique=True, index=True)  # e.g. "KC", "BUF"
     name: Mapped[str]                                            # e.g. "Kansas City Chiefs"
     conference: Mapped[str | None]                               # AFC / NFC
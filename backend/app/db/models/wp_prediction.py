@@ -3,22 +3,25 @@ from __future__ import annotations
 import uuid
 from datetime import datetime
 
-from sqlalchemy import Float, ForeignKey, func
+from sqlalchemy import REAL, ForeignKey, Index, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.db.base import Base
+from app.db.base import Base, uuid7
 
 
 class WpPrediction(Base):
     __tablename__ = "wp_predictions"
+    __table_args__ = (
+        Index("ix_wp_predictions_play_wp", "play_id", postgresql_include=["home_wp", "away_wp"]),
+    )
 
-    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid.uuid4)
-    play_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("plays.id"), index=True)
+    id: Mapped[uuid.UUID] = mapped_column(primary_key=True, default=uuid7)
+    play_id: Mapped[uuid.UUID] = mapped_column(ForeignKey("plays.id"))
     model_version_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("model_versions.id"), index=True
     )
-    home_wp: Mapped[float] = mapped_column(Float)
-    away_wp: Mapped[float] = mapped_column(Float)
+    home_wp: Mapped[float] = mapped_column(REAL)
+    away_wp: Mapped[float] = mapped_column(REAL)
     predicted_at: Mapped[datetime] = mapped_column(server_default=func.now())
 
     # Relationships
@@ -8,10 +8,11 @@ import asyncio
 import uuid
 from datetime import datetime, timezone
 
-from sqlalchemy import select
+from sqlalchemy import select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.config import get_settings
-from app.db.base import init_db, get_session_factory
+from app.db.base import ensure_db, get_engine, uuid7
 from app.db.models.team import Team
 from app.db.models.game import Game, GameStatus
 from app.db.models.model_version import ModelVersion
@@ -60,133 +61,137 @@ NFL_TEAMS = [
 ]
 
 
-async def seed() -> None:
-    settings = get_settings()
-    init_db(settings.database_url)
-    factory = get_session_factory()
-
-    async with factory() as session:
-        # Seed teams (idempotent — skip if abbr already exists)
-        existing = (await session.execute(select(Team.abbr))).scalars().all()
-        existing_set = set(existing)
-
-        new_teams = []
-        for t in NFL_TEAMS:
-            if t["abbr"] not in existing_set:
-                new_teams.append(Team(id=uuid.uuid4(), **t))
-
-        if new_teams:
-            session.add_all(new_teams)
-            await session.commit()
-            print(f"Seeded {len(new_teams)} teams.")
-        else:
-            print("Teams already seeded.")
+SAMPLE_GAME_ID = uuid.UUID("00000000-0000-0000-0000-000000000001")
+DEMO_GAME_ID = uuid.UUID("00000000-0000-0000-0000-000000000002")
+PHI_GAME_ID = uuid.UUID("00000000-0000-0000-0000-000000000003")
+
+
+def _seed_games(team_ids: dict[str, uuid.UUID]) -> list[dict]:
+    """Fixed demo games, skipping any whose teams aren't present."""
+    games = [
+        # 2022 AFC Championship: KC vs CIN
+        dict(
+            id=SAMPLE_GAME_ID, season=2022, week=20, home="KC", away="CIN",
+            nflfastr_game_id="2022_21_CIN_KC",
+            scheduled_at=datetime(2023, 1, 29, 18, 30),
+            started_at=datetime(2023, 1, 29, 18, 35),
+            final_home_score=23, final_away_score=20, venue="Arrowhead Stadium",
+        ),
+        # DAL @ WAS, Week 18 2023
+        dict(
+            id=DEMO_GAME_ID, season=2023, week=18, home="WAS", away="DAL",
+            nflfastr_game_id="2023_18_DAL_WAS",
+            scheduled_at=datetime(2024, 1, 7, 13, 0),
+            started_at=datetime(2024, 1, 7, 13, 5),
+            final_home_score=10, final_away_score=38, venue="FedExField",
+        ),
+        # LA Rams @ PHI Eagles, Week 3 2025
+        dict(
+            id=PHI_GAME_ID, season=2025, week=3, home="PHI", away="LAR",
+            nflfastr_game_id="2025_03_LA_PHI",
+            scheduled_at=datetime(2025, 9, 21, 13, 0),
+            started_at=datetime(2025, 9, 21, 13, 5),
+            final_home_score=33, final_away_score=26, venue="Lincoln Financial Field",
+        ),
+    ]
+    rows = []
+    for g in games:
+        home, away = g.pop("home"), g.pop("away")
+        if home in team_ids and away in team_ids:
+            rows.append({
+                **g,
+                "home_team_id": team_ids[home],
+                "away_team_id": team_ids[away],
+                "status": GameStatus.final,
+            })
+    return rows
 
-        # Refresh to get IDs
-        all_teams = {t.abbr: t for t in (await session.execute(select(Team))).scalars().all()}
-
-        # Seed one sample game (2022 AFC Championship: KC vs CIN)
-        sample_id = uuid.UUID("00000000-0000-0000-0000-000000000001")
-        existing_game = (
-            await session.execute(select(Game).where(Game.id == sample_id))
-        ).scalar_one_or_none()
 
-        if existing_game is None and "KC" in all_teams and "CIN" in all_teams:
-            sample_game = Game(
-                id=sample_id,
-                season=2022,
-                week=20,  # AFC Championship
-                home_team_id=all_teams["KC"].id,
-                away_team_id=all_teams["CIN"].id,
-                status=GameStatus.final,
-                nflfastr_game_id="2022_21_CIN_KC",
-                scheduled_at=datetime(2023, 1, 29, 18, 30),
-                started_at=datetime(2023, 1, 29, 18, 35),
-                final_home_score=23,
-                final_away_score=20,
-                venue="Arrowhead Stadium",
+async def seed() -> None:
+    factory = ensure_db(get_settings().database_url)
+
+    # Everything goes in one transaction: one commit instead of one per step
+    async with factory() as session, session.begin():
+        # Dev seed: durability isn't needed, so skip the commit fsync.
+        await session.execute(text("SET LOCAL synchronous_commit = OFF"))
+
+        # Seed teams (idempotent — existing abbrs are skipped server-side)
+        result = await session.execute(
+            pg_insert(Team)
+            .values([{"id": uuid7(), **t} for t in NFL_TEAMS])
+            .on_conflict_do_nothing(index_elements=["abbr"])
+            .returning(Team.id)
+        )
+        seeded_teams = len(result.all())
+
+        team_ids = dict((await session.execute(select(Team.abbr, Team.id))).all())
+
+        # Seed the demo games in one multi-row insert; any conflict (id or
+        # natural key) means that game is already there
+        game_rows = _seed_games(team_ids)
+        seeded_games: set[uuid.UUID] = set()
+        if game_rows:
+            result = await session.execute(
+                pg_insert(Game).values(game_rows).on_conflict_do_nothing().returning(Game.id)
+            )
+            seeded_games = set(result.scalars().all())
+
+        # An older seed inserted DAL @ WAS unfinished; make sure it's final
+        demo_updated = False
+        if DEMO_GAME_ID not in seeded_games:
+            result = await session.execute(
+                update(Game)
+                .where(Game.id == DEMO_GAME_ID)
+                .values(status=GameStatus.final, final_home_score=10, final_away_score=38)
+            )
+            demo_updated = result.rowcount > 0
+
+        # Seed model version; skipped if there's already a current version
+        # (partial unique index on is_current) or one with this name
+        seeded_mv = (
+            await session.execute(
+                pg_insert(ModelVersion)
+                .values(
+                    id=uuid7(),
+                    name="xgb_20260219_082135",
+                    artifact_path="xgb_20260219_082135.joblib",
+                    is_current=True,
+                    trained_on_seasons=[
+                        "2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023",
+                    ],
+                )
+                .on_conflict_do_nothing()
+                .returning(ModelVersion.name)
             )
-            session.add(sample_game)
-            await session.commit()
-            print(f"Seeded sample game: KC vs CIN (id={sample_id})")
-        else:
-            print("Sample game already seeded.")
-
-        # Seed demo game: DAL @ WAS, Week 18 2023
-        demo_id = uuid.UUID("00000000-0000-0000-0000-000000000002")
-        existing_demo = (
-            await session.execute(select(Game).where(Game.id == demo_id))
-        ).scalar_one_or_none()
-
-        if existing_demo is None and "DAL" in all_teams and "WAS" in all_teams:
-            session.add(Game(
-                id=demo_id,
-                season=2023,
-                week=18,
-                home_team_id=all_teams["WAS"].id,
-                away_team_id=all_teams["DAL"].id,
-                status=GameStatus.final,
-                nflfastr_game_id="2023_18_DAL_WAS",
-                scheduled_at=datetime(2024, 1, 7, 13, 0),
-                started_at=datetime(2024, 1, 7, 13, 5),
-                final_home_score=10,
-                final_away_score=38,
-                venue="FedExField",
-            ))
-            await session.commit()
-            print("Seeded demo game: DAL @ WAS")
-        elif existing_demo is not None:
-            existing_demo.status = GameStatus.final
-            existing_demo.final_home_score = 10
-            existing_demo.final_away_score = 38
-            await session.commit()
-            print("Updated DAL @ WAS to final")
-
-        # Seed game: LA Rams @ PHI Eagles, Week 3 2025
-        phi_id = uuid.UUID("00000000-0000-0000-0000-000000000003")
-        existing_phi = (
-            await session.execute(select(Game).where(Game.id == phi_id))
         ).scalar_one_or_none()
 
-        if existing_phi is None and "LAR" in all_teams and "PHI" in all_teams:
-            session.add(Game(
-                id=phi_id,
-                season=2025,
-                week=3,
-                home_team_id=all_teams["PHI"].id,
-                away_team_id=all_teams["LAR"].id,
-                status=GameStatus.final,
-                nflfastr_game_id="2025_03_LA_PHI",
-                scheduled_at=datetime(2025, 9, 21, 13, 0),
-                started_at=datetime(2025, 9, 21, 13, 5),
-                final_home_score=33,
-                final_away_score=26,
-                venue="Lincoln Financial Field",
-            ))
-            await session.commit()
-            print("Seeded game: LA @ PHI 2025")
+    if seeded_teams:
+        print(f"Seeded {seeded_teams} teams.")
+    else:
+        print("Teams already seeded.")
+    for game_id, label in (
+        (SAMPLE_GAME_ID, f"sample game: KC vs CIN (id={SAMPLE_GAME_ID})"),
+        (DEMO_GAME_ID, "demo game: DAL @ WAS"),
+        (PHI_GAME_ID, "game: LA @ PHI 2025"),
+    ):
+        if game_id in seeded_games:
+            print(f"Seeded {label}")
         else:
-            print("LA @ PHI already seeded.")
+            print(f"Already seeded: {label}")
+    if demo_updated:
+        print("Updated DAL @ WAS to final")
+    if seeded_mv is not None:
+        print(f"Seeded model version: {seeded_mv}")
+    else:
+        print("Model version already seeded.")
 
-        # Seed model version
-        existing_mv = (
-            await session.execute(select(ModelVersion).where(ModelVersion.is_current.is_(True)))
-        ).scalar_one_or_none()
 
-        if existing_mv is None:
-            mv = ModelVersion(
-                id=uuid.uuid4(),
-                name="xgb_20260219_082135",
-                artifact_path="xgb_20260219_082135.joblib",
-                is_current=True,
-                trained_on_seasons=["2016", "2017", "2018", "2019", "2020", "2021", "2022", "2023"],
-            )
-            session.add(mv)
-            await session.commit()
-            print(f"Seeded model version: {mv.name}")
-        else:
-            print(f"Model version already seeded: {existing_mv.name}")
+async def _main() -> None:
+    try:
+        await seed()
+    finally:
+        await get_engine().dispose()
 
 
 if __name__ == "__main__":
-    asyncio.run(seed())
+    asyncio.run(_main())
@@ -5,10 +5,9 @@ from typing import Annotated
 
 import redis.asyncio as aioredis
 from fastapi import Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.config import Settings, get_settings
-from app.db.base import get_session_factory
 
 # ── Settings ──────────────────────────────────────────────────────────────────
 
@@ -23,9 +22,18 @@ SettingsDep = Annotated[Settings, Depends(_get_settings)]
 # ── Database session ──────────────────────────────────────────────────────────
 
 
+_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+
+def set_session_factory(factory: async_sessionmaker[AsyncSession]) -> None:
+    global _session_factory
+    _session_factory = factory
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    factory = get_session_factory()
-    async with factory() as session:
+    if _session_factory is None:
+        raise RuntimeError("Session factory not initialised.")
+    async with _session_factory() as session:
         yield session
 
 
@@ -8,8 +8,10 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import get_settings
-from app.db.base import init_db
-from app.deps import set_redis_pool
+from app.db.base import get_session_factory, init_db, warm_pool
+from app.deps import set_redis_pool, set_session_factory
+from app.ml import registry
+from app.services.shap_service import ShapService
 from app.utils.cache import init_cache
 
 logger = logging.getLogger(__name__)
@@ -25,22 +27,42 @@ async def lifespan(app: FastAPI):
     # Initialise database
     logger.info("Initialising database connection...")
     init_db(settings.database_url)
+    set_session_factory(get_session_factory())
+    try:
+        await warm_pool()
+    except Exception as exc:
+        # Not fatal — /health reports the DB as degraded until it's reachable
+        logger.warning("Could not pre-warm DB pool: %s", exc)
 
     # Initialise Redis
     logger.info("Initialising Redis connection...")
-    redis_client = aioredis.from_url(
+    redis_pool = aioredis.ConnectionPool.from_url(
         settings.redis_url,
-        encoding="utf-8",
-        decode_responses=True,
+        max_connections=settings.redis_pool_size,
+        # Values are JSON blobs relayed as-is (e.g. the SSE snapshot), so
+        # skip decoding every reply into a str
+        decode_responses=False,
     )
+    redis_client = aioredis.Redis(connection_pool=redis_pool)
     set_redis_pool(redis_client)
     init_cache(redis_client)
 
+    # Load the current model up front, over the shared DB pool
+    try:
+        await registry.preload()
+        # Build the SHAP explainer now rather than on the first explained play
+        model, version_id, _ = await registry.get_current()
+        ShapService.prebuild(version_id, model)
+    except Exception as exc:
+        # Not fatal — e.g. no model trained yet; get_current() retries lazily
+        logger.warning("Could not preload model: %s", exc)
+
     logger.info("ClutchFactor backend ready.")
     yield
 
     # Teardown
     await redis_client.aclose()
+    await redis_pool.disconnect(inuse_connections=False)
     logger.info("Shutdown complete.")
 
 
@@ -58,8 +80,8 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.cors_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=settings.cors_methods,
+        allow_headers=settings.cors_headers,
     )
 
     # Register all routes
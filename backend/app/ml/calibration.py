@@ -18,7 +18,34 @@ class _CalibratedModel:
         self.xgb = xgb
         self.iso = iso
 
+    def _iso_table(self) -> tuple[np.ndarray, np.ndarray]:
+        # Built lazily: unpickled instances skip __init__
+        table = self.__dict__.get("_iso_xy")
+        if table is None:
+            table = (
+                np.asarray(self.iso.X_thresholds_, dtype=np.float64),
+                np.asarray(self.iso.y_thresholds_, dtype=np.float64),
+            )
+            self._iso_xy = table
+        return table
+
     def predict_proba(self, X: np.ndarray) -> np.ndarray:
-        raw = self.xgb.predict_proba(X)[:, 1]
-        cal = self.iso.predict(raw)
-        return np.column_stack([1.0 - cal, cal])
+        # inplace_predict gives the positive-class probability as 1-D directly,
+        # skipping the (N, 2) array XGBClassifier.predict_proba builds.
+        # Honour early stopping the same way predict_proba does.
+        best = getattr(self.xgb, "best_iteration", None)
+        raw = self.xgb.get_booster().inplace_predict(
+            X,
+            iteration_range=(0, best + 1) if best is not None else (0, 0),
+            missing=self.xgb.missing,
+        )
+        x, y = self._iso_table()
+        # Same piecewise-linear curve IsotonicRegression.predict evaluates,
+        # without its per-call validation/interp1d overhead
+        cal = np.interp(raw, x, y)
+        if self.iso.out_of_bounds == "nan":
+            cal[(raw < x[0]) | (raw > x[-1])] = np.nan
+        out = np.empty((cal.shape[0], 2), dtype=cal.dtype)
+        out[:, 1] = cal
+        np.subtract(1.0, cal, out=out[:, 0])
+        return out
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections.abc import Sequence
+
 import numpy as np
 import pandas as pd
 
@@ -62,15 +64,32 @@ FEATURE_DISPLAY_NAMES: dict[str, str] = {
 }
 
 
+# Per-column defaults in FEATURE_COLS order; copied as the scratch buffer
+# for each extract_features() call
+_FEATURE_DEFAULTS = np.array([FILL_VALUES[c] for c in FEATURE_COLS], dtype=np.float32)
+_DERIVED_COLS = ("spread_time", "diff_time_ratio")
+_RAW_FEATURES: tuple[tuple[int, str, float], ...] = tuple(
+    (i, col, FILL_VALUES[col])
+    for i, col in enumerate(FEATURE_COLS)
+    if col not in _DERIVED_COLS
+)
+# Fixed slots used by the derived-feature math (the column order is baked in)
+_I_GAME_SECS = FEATURE_COLS.index("game_seconds_remaining")
+_I_SPREAD = FEATURE_COLS.index("spread_line")
+_I_SCORE_DIFF = FEATURE_COLS.index("score_differential")
+_I_SPREAD_TIME = FEATURE_COLS.index("spread_time")
+_I_DIFF_TIME = FEATURE_COLS.index("diff_time_ratio")
+
+
 def _fill(val, default: float) -> float:
     """Return val as float, or default if None/NaN."""
     if val is None:
         return default
     try:
         v = float(val)
-        return default if np.isnan(v) else v
     except (TypeError, ValueError):
         return default
+    return default if v != v else v
 
 
 def extract_features(play: dict) -> np.ndarray:
@@ -81,29 +100,17 @@ def extract_features(play: dict) -> np.ndarray:
     Computes derived features (spread_time, diff_time_ratio) inline.
     Returns shape (1, len(FEATURE_COLS)).
     """
-    def _get(key: str) -> float:
-        return _fill(play.get(key), FILL_VALUES[key])
-
-    # Raw values needed for derived features
-    game_secs = _get("game_seconds_remaining")
-    spread = _get("spread_line")
-    score_diff = _get("score_differential")
-
-    # Derived features
-    spread_time = spread * (game_secs / 3600.0)
-    diff_time_ratio = score_diff * (1.0 - game_secs / 3600.0)
+    out = _FEATURE_DEFAULTS.copy()
+    for i, col, default in _RAW_FEATURES:
+        val = play.get(col)
+        if val is not None:
+            out[i] = _fill(val, default)
 
-    augmented = {
-        **play,
-        "spread_time": spread_time,
-        "diff_time_ratio": diff_time_ratio,
-    }
-
-    def _get2(key: str) -> float:
-        return _fill(augmented.get(key), FILL_VALUES[key])
-
-    features = [_get2(col) for col in FEATURE_COLS]
-    return np.array([features], dtype=np.float32)
+    # Derived features (any values for these keys in `play` are ignored)
+    game_secs = float(out[_I_GAME_SECS])
+    out[_I_SPREAD_TIME] = float(out[_I_SPREAD]) * (game_secs / 3600.0)
+    out[_I_DIFF_TIME] = float(out[_I_SCORE_DIFF]) * (1.0 - game_secs / 3600.0)
+    return out.reshape(1, -1)
 
 
 def build_feature_matrix(df: pd.DataFrame) -> np.ndarray:
@@ -111,21 +118,33 @@ def build_feature_matrix(df: pd.DataFrame) -> np.ndarray:
     Convert a DataFrame (nflfastR play-by-play) to a feature matrix.
     Applies fill values for NaN entries and computes derived features.
     """
-    df = df.copy()
-
-    # Fill raw columns first so derived features use clean values
-    for col in ["game_seconds_remaining", "spread_line", "score_differential"]:
-        if col in df.columns:
-            df[col] = df[col].fillna(FILL_VALUES[col])
+    mat = np.empty((len(df), len(FEATURE_COLS)), dtype=np.float32)
+    # Cast + NaN fill fused into one pass per raw column
+    for i, col, default in _RAW_FEATURES:
+        mat[:, i] = df[col].to_numpy(dtype=np.float32, na_value=default)
 
-    # Compute derived features
-    game_secs = df["game_seconds_remaining"]
-    df["spread_time"] = df["spread_line"] * (game_secs / 3600.0)
-    df["diff_time_ratio"] = df["score_differential"] * (1.0 - game_secs / 3600.0)
+    _fill_derived(mat)
+    return mat
 
-    subset = df[FEATURE_COLS].copy()
-    for col, fill in FILL_VALUES.items():
-        if col in subset.columns:
-            subset[col] = subset[col].fillna(fill)
 
-    return subset.values.astype(np.float32)
+def build_feature_matrix_from_dicts(rows: Sequence[dict]) -> np.ndarray:
+    """
+    Same as build_feature_matrix(), but straight from a list of play dicts
+    (extract_features() semantics per row) without building a DataFrame.
+    """
+    mat = np.tile(_FEATURE_DEFAULTS, (len(rows), 1))
+    for r, play in enumerate(rows):
+        row = mat[r]
+        for i, col, default in _RAW_FEATURES:
+            val = play.get(col)
+            if val is not None:
+                row[i] = _fill(val, default)
+    _fill_derived(mat)
+    return mat
+
+
+def _fill_derived(mat: np.ndarray) -> None:
+    """Compute the derived columns in place, in float64 like extract_features()."""
+    game_secs = mat[:, _I_GAME_SECS].astype(np.float64)
+    mat[:, _I_SPREAD_TIME] = mat[:, _I_SPREAD] * (game_secs / 3600.0)
+    mat[:, _I_DIFF_TIME] = mat[:, _I_SCORE_DIFF] * (1.0 - game_secs / 3600.0)
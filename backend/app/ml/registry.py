@@ -2,18 +2,22 @@
 Model registry: loads and caches the current model artifact.
 
 Supports two artifact formats:
-  .joblib  — CalibratedClassifierCV wrapping XGBoost (current default)
-  .ubj     — Raw XGBoost native format (legacy)
+  .ubj     — Raw XGBoost native format (current default, written by train.py)
+  .joblib  — pickled XGBClassifier / calibrated wrapper (older artifacts)
 
 The module-level singleton avoids reloading on every request.
 Cache is invalidated by calling `invalidate()`.
 """
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
 import uuid
+from collections.abc import Callable
 from pathlib import Path
 
+import numpy as np
 from xgboost import XGBClassifier
 
 logger = logging.getLogger(__name__)
@@ -22,6 +26,14 @@ _cached_model = None  # CalibratedClassifierCV | XGBClassifier
 _cached_version_id: uuid.UUID | None = None
 _cached_version_name: str | None = None
 
+# (model, unwrapped XGBClassifier) for the last model passed to get_xgb_model
+_xgb_for: tuple[object, XGBClassifier] | None = None
+# (model, home-win predictor) for the last model passed to get_predictor
+_predictor_for: tuple[object, Callable[[np.ndarray], np.ndarray]] | None = None
+
+# Serialises cold loads so concurrent first callers don't each read the artifact
+_load_lock = asyncio.Lock()
+
 
 async def get_current() -> tuple:
     """
@@ -30,28 +42,44 @@ async def get_current() -> tuple:
     model is either a CalibratedClassifierCV (.joblib) or XGBClassifier (.ubj).
     Both expose .predict_proba(). Use get_xgb_model(model) for Tree SHAP.
     """
-    global _cached_model, _cached_version_id, _cached_version_name
-
     if _cached_model is not None and _cached_version_id is not None:
         return _cached_model, _cached_version_id, _cached_version_name
 
+    async with _load_lock:
+        if _cached_model is not None and _cached_version_id is not None:
+            return _cached_model, _cached_version_id, _cached_version_name
+        return await _load_current()
+
+
+async def _load_current() -> tuple:
+    global _cached_model, _cached_version_id, _cached_version_name
+
     from sqlalchemy import select
     from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
     from app.config import get_settings
+    from app.db.base import get_session_factory
     from app.db.models.model_version import ModelVersion
 
     settings = get_settings()
-    engine = create_async_engine(settings.database_url)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with factory() as session:
-        result = await session.execute(
-            select(ModelVersion).where(ModelVersion.is_current.is_(True))
-        )
-        mv = result.scalar_one_or_none()
-
-    await engine.dispose()
+    engine = None
+    try:
+        factory = get_session_factory()
+    except RuntimeError:
+        # Outside the API process (e.g. one-off scripts) there's no shared
+        # engine; use a short-lived one.
+        engine = create_async_engine(settings.database_url)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with factory() as session:
+            result = await session.execute(
+                select(ModelVersion).where(ModelVersion.is_current.is_(True))
+            )
+            mv = result.scalar_one_or_none()
+    finally:
+        if engine is not None:
+            await engine.dispose()
 
     if mv is None:
         raise RuntimeError(
@@ -76,6 +104,11 @@ async def get_current() -> tuple:
     return model, mv.id, mv.name
 
 
+async def preload() -> None:
+    """Load the current model at startup so the first request doesn't pay for it."""
+    await get_current()
+
+
 def _load_artifact(path: Path):
     """Load a model artifact based on its file extension."""
     suffix = path.suffix.lower()
@@ -99,7 +132,19 @@ def get_xgb_model(model) -> XGBClassifier:
       - _CalibratedModel (train.py wrapper): has .xgb attribute
       - CalibratedClassifierCV (sklearn): has .calibrated_classifiers_
       - Raw XGBClassifier: returned as-is
+
+    The result for the most recent model is memoised, so the per-prediction
+    SHAP path is an identity check rather than a hasattr chain.
     """
+    global _xgb_for
+    if _xgb_for is not None and _xgb_for[0] is model:
+        return _xgb_for[1]
+    xgb = _unwrap_xgb(model)
+    _xgb_for = (model, xgb)
+    return xgb
+
+
+def _unwrap_xgb(model) -> XGBClassifier:
     # Our custom calibrated wrapper
     if hasattr(model, "xgb"):
         return model.xgb
@@ -112,10 +157,40 @@ def get_xgb_model(model) -> XGBClassifier:
     raise TypeError(f"Cannot extract XGBClassifier from {type(model)}")
 
 
+def get_predictor(model) -> Callable[[np.ndarray], np.ndarray]:
+    """
+    Return a function mapping a feature matrix to 1-D P(home win).
+
+    For a raw XGBClassifier this is Booster.inplace_predict bound to the same
+    iteration range and missing value predict_proba would use, which skips
+    the sklearn wrapper and the (N, 2) array it builds. Other models (the
+    calibrated wrapper already predicts in place) go through predict_proba.
+    Memoised for the most recent model, like get_xgb_model.
+    """
+    global _predictor_for
+    if _predictor_for is not None and _predictor_for[0] is model:
+        return _predictor_for[1]
+    if isinstance(model, XGBClassifier):
+        # Honour early stopping the same way predict_proba does
+        best = getattr(model, "best_iteration", None)
+        predictor = functools.partial(
+            model.get_booster().inplace_predict,
+            iteration_range=(0, best + 1) if best is not None else (0, 0),
+            missing=model.missing,
+        )
+    else:
+        def predictor(features: np.ndarray) -> np.ndarray:
+            return model.predict_proba(features)[:, 1]
+    _predictor_for = (model, predictor)
+    return predictor
+
+
 def invalidate() -> None:
     """Force reload on next get_current() call."""
-    global _cached_model, _cached_version_id, _cached_version_name
+    global _cached_model, _cached_version_id, _cached_version_name, _xgb_for, _predictor_for
     _cached_model = None
     _cached_version_id = None
     _cached_version_name = None
+    _xgb_for = None
+    _predictor_for = None
     logger.info("Model cache invalidated.")
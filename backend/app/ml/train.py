@@ -11,22 +11,23 @@ from __future__ import annotations
 
 import argparse
 import asyncio
+import hashlib
 import logging
-import uuid
+import os
 from datetime import datetime, timezone
 from pathlib import Path
 
-import joblib
 import numpy as np
 import pandas as pd
-from sklearn.calibration import calibration_curve
 from sklearn.isotonic import IsotonicRegression
 from xgboost import XGBClassifier
 
 from app.config import get_settings
+from app.db.base import uuid7
 from app.ml.calibration import _CalibratedModel
-from app.ml.evaluate import compute_metrics
-from app.ml.features import FEATURE_COLS, FILL_VALUES, build_feature_matrix
+from app.ml.evaluate import calibration_data, compute_metrics
+from app.ml.features import FEATURE_COLS, build_feature_matrix
+from app.utils.csv_io import CSV_ENGINE, HAS_PYARROW, present_columns
 
 logger = logging.getLogger(__name__)
 
@@ -37,13 +38,35 @@ NFLVERSE_BASE = "https://github.com/nflverse/nflverse-data/releases/download/pbp
 # Play types to keep (exclude non-football rows)
 VALID_PLAY_TYPES = {"pass", "run", "field_goal", "punt", "extra_point", "kickoff", "no_play"}
 
+# Source columns prepare_dataset() reads; the PBP CSVs have ~370
+TRAIN_SOURCE_COLS = [
+    "game_id", "qtr", "play_type", "result",
+    "down", "ydstogo", "yards_to_go", "yardline_100",
+    "game_seconds_remaining", "half_seconds_remaining",
+    "total_home_score", "total_away_score",
+    "posteam", "home_team", "home_opening_kickoff",
+    "posteam_timeouts_remaining", "defteam_timeouts_remaining",
+    "spread_line", "ep",
+]
+# Low-cardinality string columns, read as categoricals (int codes, not objects)
+TRAIN_CATEGORY_COLS = ["game_id", "play_type", "posteam", "home_team"]
 
-def download_season(season: int) -> Path:
-    """Download a single season's play-by-play CSV. Returns path to decompressed CSV."""
+
+# Seasons fetched at once; each is a 50–200 MB network-bound transfer
+DOWNLOAD_CONCURRENCY = 4
+
+
+def _decompress(gz_path: Path, csv_path: Path) -> None:
     import gzip
     import shutil
 
-    import httpx
+    logger.info("Decompressing %s ...", gz_path)
+    with gzip.open(gz_path, "rb") as f_in, open(csv_path, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out)
+    gz_path.unlink()
+
+
+async def _download_season_async(client, season: int) -> Path:
     from tqdm import tqdm
 
     DATA_DIR.mkdir(parents=True, exist_ok=True)
@@ -57,33 +80,106 @@ def download_season(season: int) -> Path:
     url = f"{NFLVERSE_BASE}/play_by_play_{season}.csv.gz"
     logger.info("Downloading %s ...", url)
 
-    with httpx.stream("GET", url, follow_redirects=True, timeout=300) as r:
+    async with client.stream("GET", url, follow_redirects=True) as r:
         r.raise_for_status()
         total = int(r.headers.get("content-length", 0))
-        with open(gz_path, "wb") as f, tqdm(total=total, unit="B", unit_scale=True) as bar:
-            for chunk in r.iter_bytes(chunk_size=65536):
+        with open(gz_path, "wb") as f, tqdm(total=total, unit="B", unit_scale=True, desc=str(season)) as bar:
+            async for chunk in r.aiter_bytes(chunk_size=65536):
                 f.write(chunk)
                 bar.update(len(chunk))
 
-    logger.info("Decompressing %s ...", gz_path)
-    with gzip.open(gz_path, "rb") as f_in, open(csv_path, "wb") as f_out:
-        shutil.copyfileobj(f_in, f_out)
-    gz_path.unlink()
-
+    await asyncio.to_thread(_decompress, gz_path, csv_path)
     return csv_path
 
 
+async def download_all(seasons: list[int]) -> dict[int, Path]:
+    """Download several seasons concurrently. Failures are logged and skipped."""
+    import httpx
+
+    sem = asyncio.Semaphore(DOWNLOAD_CONCURRENCY)
+
+    async def one(client, season: int) -> Path:
+        async with sem:
+            return await _download_season_async(client, season)
+
+    async with httpx.AsyncClient(timeout=300) as client:
+        results = await asyncio.gather(
+            *(one(client, s) for s in seasons), return_exceptions=True
+        )
+
+    paths = {}
+    for season, result in zip(seasons, results):
+        if isinstance(result, BaseException):
+            logger.warning("Could not download season %d: %s", season, result)
+        else:
+            paths[season] = result
+    return paths
+
+
+def download_season(season: int) -> Path:
+    """Download a single season's play-by-play CSV. Returns path to decompressed CSV."""
+    import httpx
+
+    async def _run() -> Path:
+        async with httpx.AsyncClient(timeout=300) as client:
+            return await _download_season_async(client, season)
+
+    return asyncio.run(_run())
+
+
 def load_season(season: int) -> pd.DataFrame:
     csv_path = DATA_DIR / f"play_by_play_{season}.csv"
     if not csv_path.exists():
         raise FileNotFoundError(
             f"Season {season} CSV not found at {csv_path}. Run `make download-data` first."
         )
-    df = pd.read_csv(csv_path, low_memory=False)
+
+    # Parsed seasons are cached next to the CSV (Parquet when pyarrow is
+    # installed, else a pickle), keyed by everything that shapes the frame and
+    # invalidated when the CSV is newer. An unreadable cache is reparsed.
+    cache_format = "parquet" if HAS_PYARROW else "pkl"
+    cache_key = hashlib.sha1(
+        repr((TRAIN_SOURCE_COLS, TRAIN_CATEGORY_COLS, CSV_ENGINE, cache_format)).encode()
+    ).hexdigest()[:8]
+    cache_path = csv_path.with_name(f"{csv_path.stem}.{cache_key}.{cache_format}")
+    if cache_path.exists() and cache_path.stat().st_mtime >= csv_path.stat().st_mtime:
+        try:
+            return _read_cache(cache_path)
+        except Exception as exc:
+            logger.warning("Ignoring unreadable cache %s: %s", cache_path, exc)
+
+    df = pd.read_csv(
+        csv_path,
+        engine=CSV_ENGINE,
+        usecols=present_columns(csv_path, TRAIN_SOURCE_COLS),
+        dtype={c: "category" for c in TRAIN_CATEGORY_COLS},
+    )
     df["season"] = season
+    _write_cache(df, cache_path)
     return df
 
 
+def _read_cache(path: Path) -> pd.DataFrame:
+    if path.suffix == ".parquet":
+        return pd.read_parquet(path)
+    return pd.read_pickle(path)
+
+
+def _write_cache(df: pd.DataFrame, path: Path) -> None:
+    # Written beside the target and renamed into place, so an interrupted run
+    # never leaves a truncated cache behind
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        if path.suffix == ".parquet":
+            df.to_parquet(tmp)
+        else:
+            df.to_pickle(tmp, compression=None)
+        os.replace(tmp, path)
+    except Exception as exc:
+        logger.warning("Could not cache %s: %s", path.name, exc)
+        tmp.unlink(missing_ok=True)
+
+
 def prepare_dataset(df: pd.DataFrame) -> pd.DataFrame:
     """
     Filter and prepare the raw nflfastR DataFrame for training.
@@ -93,11 +189,9 @@ def prepare_dataset(df: pd.DataFrame) -> pd.DataFrame:
     - Create target column: home_team_wins = (result > 0)
     - Compute features consistent with inference-time GameState
     """
-    # result = home_score - away_score at end of game (nflfastR convention)
-    df = df[df["result"].notna()].copy()
-
-    # Filter play types
-    df = df[df["play_type"].isin(VALID_PLAY_TYPES)].copy()
+    # result = home_score - away_score at end of game (nflfastR convention).
+    # Completed games and valid play types in one mask, so only one copy.
+    df = df[df["result"].notna() & df["play_type"].isin(VALID_PLAY_TYPES)].copy()
 
     # ── Column aliases ────────────────────────────────────────────────────────
     if "ydstogo" in df.columns and "yards_to_go" not in df.columns:
@@ -112,16 +206,20 @@ def prepare_dataset(df: pd.DataFrame) -> pd.DataFrame:
     # ── Possession features ───────────────────────────────────────────────────
     # posteam_is_home: 1 if the team with possession is the home team
     if "posteam" in df.columns and "home_team" in df.columns:
-        df["posteam_is_home"] = (df["posteam"] == df["home_team"]).astype(float)
+        pih = df["posteam"].to_numpy() == df["home_team"].to_numpy()
+        df["posteam_is_home"] = pih.astype(np.float32)
     else:
+        pih = np.zeros(len(df), dtype=bool)
         df["posteam_is_home"] = 0.5  # unknown
 
     # receive_2h_ko: 1 if possession team will receive the 2nd-half kickoff.
     # Formula: home_opening_kickoff XOR posteam_is_home
     if "home_opening_kickoff" in df.columns:
-        hok = df["home_opening_kickoff"].fillna(0).astype(int)
-        pih = df["posteam_is_home"].fillna(0).astype(int)
-        df["receive_2h_ko"] = (hok != pih).astype(float)
+        hok = np.nan_to_num(
+            pd.to_numeric(df["home_opening_kickoff"], errors="coerce").to_numpy(dtype=np.float64),
+            nan=0.0,
+        ).astype(np.int64)
+        df["receive_2h_ko"] = (hok != pih).astype(np.float32)
     else:
         df["receive_2h_ko"] = 0.0
 
@@ -136,10 +234,10 @@ def prepare_dataset(df: pd.DataFrame) -> pd.DataFrame:
     available = [c for c in needed if c in df.columns]
     df = df[available].copy()
 
-    # Coerce to numeric
-    for col in raw_feature_cols:
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+    # Coerce to numeric in one batch over the feature columns present. Stored as
+    # float32: build_feature_matrix and XGBoost work in float32 anyway.
+    num_cols = [c for c in raw_feature_cols if c in df.columns]
+    df[num_cols] = df[num_cols].apply(pd.to_numeric, errors="coerce").astype(np.float32)
 
     return df
 
@@ -153,32 +251,73 @@ async def register_model_version(
 ) -> None:
     from sqlalchemy import update
     from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+    from app.db.base import get_session_factory
     from app.db.models.model_version import ModelVersion
 
     settings = get_settings()
-    engine = create_async_engine(settings.database_url)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
-
-    async with factory() as session:
-        # Set all existing versions to is_current=False
-        await session.execute(
-            update(ModelVersion).values(is_current=False)
-        )
-        # Insert new version
-        mv = ModelVersion(
-            id=uuid.uuid4(),
-            name=name,
-            artifact_path=artifact_path,
-            brier_score=brier_score,
-            log_loss_val=log_loss_val,
-            trained_on_seasons=trained_on_seasons,
-            is_current=True,
-        )
-        session.add(mv)
-        await session.commit()
-        logger.info("Registered model version '%s' in database.", name)
+    engine = None
+    try:
+        factory = get_session_factory()
+    except RuntimeError:
+        # Standalone CLI run: no app-level engine, so use a short-lived one.
+        engine = create_async_engine(settings.database_url)
+        factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
+    try:
+        async with factory() as session:
+            # Set all existing versions to is_current=False
+            await session.execute(
+                update(ModelVersion).values(is_current=False)
+            )
+            # Insert new version
+            mv = ModelVersion(
+                id=uuid7(),
+                name=name,
+                artifact_path=artifact_path,
+                brier_score=brier_score,
+                log_loss_val=log_loss_val,
+                trained_on_seasons=trained_on_seasons,
+                is_current=True,
+            )
+            session.add(mv)
+            await session.commit()
+            logger.info("Registered model version '%s' in database.", name)
+    finally:
+        if engine is not None:
+            await engine.dispose()
+
+
+def _per_quarter_stats(
+    y_true: np.ndarray,
+    y_prob: np.ndarray,
+    qtr: np.ndarray,
+    n_bins: int = 8,
+) -> dict[int, tuple[int, float, float]]:
+    """Return {quarter: (n, brier, max_calibration_gap)} in one pass.
 
-    await engine.dispose()
+    Every (quarter, bin) cell is accumulated with a single bincount over a
+    combined index; bins match sklearn's calibration_curve.
+    """
+    qtr = np.asarray(qtr, dtype=np.float64)
+    known = ~np.isnan(qtr)
+    y_true = np.asarray(y_true, dtype=np.float64)[known]
+    y_prob = np.asarray(y_prob, dtype=np.float64)[known]
+    quarters, q_idx = np.unique(qtr[known], return_inverse=True)
+    n_q = len(quarters)
+
+    bins = np.searchsorted(np.linspace(0.0, 1.0, n_bins + 1)[1:-1], y_prob)
+    cell = q_idx * n_bins + bins
+    counts = np.bincount(cell, minlength=n_q * n_bins).reshape(n_q, n_bins)
+    pos = np.bincount(cell, weights=y_true, minlength=n_q * n_bins).reshape(n_q, n_bins)
+    prob_sum = np.bincount(cell, weights=y_prob, minlength=n_q * n_bins).reshape(n_q, n_bins)
+
+    n = counts.sum(axis=1)
+    sq_err = np.bincount(q_idx, weights=(y_prob - y_true) ** 2, minlength=n_q)
+    gaps = (np.abs(pos - prob_sum) / np.maximum(counts, 1)).max(axis=1)
+    return {
+        int(q): (int(n[i]), float(sq_err[i] / n[i]), float(gaps[i]))
+        for i, q in enumerate(quarters)
+    }
 
 
 def _calibration_report(
@@ -189,20 +328,27 @@ def _calibration_report(
 ) -> None:
     """Print overall + per-quarter calibration summary."""
     metrics = compute_metrics(y_true, y_prob)
-    frac, mean_pred = calibration_curve(y_true, y_prob, n_bins=10)
-    max_gap = float(np.max(np.abs(frac - mean_pred)))
+    curve = calibration_data(y_true, y_prob, n_bins=10)
+    max_gap = float(np.max(np.abs(
+        np.asarray(curve["fraction_of_positives"]) - np.asarray(curve["mean_predicted_value"])
+    )))
     print(f"\n  [{label}]  Brier={metrics['brier_score']:.4f}  LogLoss={metrics['log_loss']:.4f}  MaxCalibGap={max_gap:.3f}")
 
     if qtr is not None:
-        for q in sorted(np.unique(qtr)):
-            mask = qtr == q
-            if mask.sum() < 50:
+        for q, (n_q, brier_q, gap_q) in _per_quarter_stats(y_true, y_prob, qtr).items():
+            if n_q < 50:
                 continue
-            fq, mq = calibration_curve(y_true[mask], y_prob[mask], n_bins=8)
-            gap_q = float(np.max(np.abs(fq - mq)))
-            brier_q = float(np.mean((y_prob[mask] - y_true[mask]) ** 2))
-            label_q = f"Q{int(q)}" if q <= 4 else "OT"
-            print(f"    {label_q}: n={mask.sum():5d}  Brier={brier_q:.4f}  MaxCalibGap={gap_q:.3f}")
+            label_q = f"Q{q}" if q <= 4 else "OT"
+            print(f"    {label_q}: n={n_q:5d}  Brier={brier_q:.4f}  MaxCalibGap={gap_q:.3f}")
+
+
+def _train_device() -> str:
+    device = get_settings().train_device.lower()
+    if device != "auto":
+        return device
+    import xgboost as xgb
+
+    return "cuda" if xgb.build_info().get("USE_CUDA") else "cpu"
 
 
 def train(
@@ -211,47 +357,48 @@ def train(
     eval_season: int,
     skip_download: bool = False,
 ) -> None:
+    # Order-preserving dedup so seasons load in the same order every run
+    all_seasons = list(dict.fromkeys(seasons + [calib_season, eval_season]))
+
     # Download seasons if needed
     if not skip_download:
-        all_seasons = list(set(seasons + [calib_season, eval_season]))
-        for s in all_seasons:
-            try:
-                download_season(s)
-            except Exception as exc:
-                logger.warning("Could not download season %d: %s", s, exc)
+        asyncio.run(download_all(all_seasons))
 
     # Load and concatenate all needed seasons
     logger.info("Loading seasons: train=%s  calib=%d  eval=%d", seasons, calib_season, eval_season)
+    # Prepare each season as it is read, so only one raw season is held at a
+    # time and the concat copies the filtered, narrowed frames.
     dfs = []
-    for s in list(set(seasons + [calib_season, eval_season])):
+    for s in all_seasons:
         try:
-            dfs.append(load_season(s))
+            dfs.append(prepare_dataset(load_season(s)))
         except FileNotFoundError as exc:
             logger.warning(str(exc))
 
     if not dfs:
         raise RuntimeError("No data loaded. Run `make download-data` first.")
 
-    raw = pd.concat(dfs, ignore_index=True)
-    df = prepare_dataset(raw)
+    df = pd.concat(dfs, ignore_index=True)
+    del dfs
 
     if "target" not in df.columns:
         raise RuntimeError("Dataset preparation failed — 'target' column missing.")
 
     # ── Season splits ─────────────────────────────────────────────────────────
-    train_mask = df["season"].isin(seasons)
-    calib_mask = df["season"] == calib_season
-    eval_mask = df["season"] == eval_season
-
-    X_train = build_feature_matrix(df[train_mask])
-    y_train = df[train_mask]["target"].values
+    # Build the feature matrix once and split it by row index
+    season_arr = df["season"].to_numpy()
+    train_idx = np.flatnonzero(np.isin(season_arr, seasons))
+    calib_idx = np.flatnonzero(season_arr == calib_season)
+    eval_idx = np.flatnonzero(season_arr == eval_season)
 
-    X_calib = build_feature_matrix(df[calib_mask])
-    y_calib = df[calib_mask]["target"].values
+    X_full = build_feature_matrix(df)
+    y_full = df["target"].to_numpy()
 
-    X_eval = build_feature_matrix(df[eval_mask])
-    y_eval = df[eval_mask]["target"].values
-    qtr_eval = df[eval_mask]["qtr"].values if "qtr" in df.columns else None
+    X_train, y_train = X_full[train_idx], y_full[train_idx]
+    X_calib, y_calib = X_full[calib_idx], y_full[calib_idx]
+    X_eval, y_eval = X_full[eval_idx], y_full[eval_idx]
+    qtr_eval = df["qtr"].to_numpy()[eval_idx] if "qtr" in df.columns else None
+    del X_full
 
     logger.info(
         "Train rows: %d  Calib rows: %d  Eval rows: %d",
@@ -259,6 +406,7 @@ def train(
     )
 
     # ── Train XGBoost ─────────────────────────────────────────────────────────
+    device = _train_device()
     model = XGBClassifier(
         n_estimators=500,
         max_depth=5,
@@ -269,16 +417,19 @@ def train(
         eval_metric="logloss",
         early_stopping_rounds=20,
         tree_method="hist",
+        device=device,
         random_state=42,
     )
 
-    logger.info("Training XGBoost model...")
+    logger.info("Training XGBoost model on %s...", device)
     model.fit(
         X_train,
         y_train,
         eval_set=[(X_eval, y_eval)],
         verbose=50,
     )
+    # Evaluate, calibrate and save for CPU inference (the API has no GPU)
+    model.set_params(device="cpu")
 
     # ── Evaluation ────────────────────────────────────────────────────────────
     raw_probs = model.predict_proba(X_eval)[:, 1]
@@ -288,7 +439,8 @@ def train(
     print("──────────────────────────────────────────────────────────────────")
 
     # ── Save artifact ─────────────────────────────────────────────────────────
-    # Save the raw XGBClassifier via joblib. Isotonic calibration was removed
+    # Save the raw XGBClassifier in XGBoost's native UBJSON format (loads
+    # without unpickling sklearn/XGBoost objects). Isotonic calibration was removed
     # because IsotonicRegression creates a step function that collapses many
     # consecutive plays to the same WP value, making the chart appear flat.
     # Raw XGBoost also scores better on Brier and LogLoss for this dataset.
@@ -296,8 +448,8 @@ def train(
     artifact_dir.mkdir(parents=True, exist_ok=True)
     timestamp = datetime.now(tz=timezone.utc).strftime("%Y%m%d_%H%M%S")
     name = f"xgb_{timestamp}"
-    artifact_path = artifact_dir / f"{name}.joblib"
-    joblib.dump(model, str(artifact_path))
+    artifact_path = artifact_dir / f"{name}.ubj"
+    model.save_model(str(artifact_path))
     logger.info("Saved model artifact: %s", artifact_path)
 
     raw_metrics = compute_metrics(y_eval, raw_probs)
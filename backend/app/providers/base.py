@@ -31,7 +31,7 @@ class GameState(TypedDict, total=False):
     ep: float | None                  # expected points for current possession
     play_type: str | None
     description: str | None
-    raw_payload: dict                 # full source row (stored in play_raw)
+    raw_payload: dict                 # source row, empty cells dropped (stored in play_raw)
 
 
 class DataProvider(ABC):
@@ -28,7 +28,9 @@ import asyncio
 import logging
 import math
 from collections.abc import AsyncIterator
+from itertools import repeat
 
+import numpy as np
 import pandas as pd
 
 from app.providers.base import DataProvider, GameState
@@ -46,12 +48,14 @@ def _safe_int(val) -> int | None:
         return None
 
 
-def _safe_float(val) -> float | None:
-    try:
-        v = float(val)
-        return None if math.isnan(v) else v
-    except (TypeError, ValueError):
-        return None
+def _nullable(col: pd.Series) -> list:
+    """Column as Python scalars with NA/NaN as None."""
+    return col.astype(object).where(col.notna(), None).tolist()
+
+
+def _nonzero_or(col: pd.Series, default: int) -> list[int]:
+    """Vectorised `_safe_int(x) or default`: missing and 0 both become default."""
+    return _nullable(col.where(col.notna() & (col != 0), default))
 
 
 def _safe_str(val) -> str | None:
@@ -89,71 +93,105 @@ class DeveloperReplayAdapter(DataProvider):
         self._df = self._df.reset_index(drop=True)
         self._nflfastr_game_id = nflfastr_game_id
         self._speed = plays_per_second
+        self._states = self._normalize_all()
         logger.info("Loaded %d plays for game %s", len(self._df), nflfastr_game_id)
 
-    def _normalize(self, row: pd.Series, sequence: int) -> GameState:
+    def _column(self, name: str) -> pd.Series:
+        if name in self._df.columns:
+            return self._df[name]
+        return pd.Series(None, index=self._df.index, dtype=object)
+
+    def _ints(self, name: str) -> pd.Series:
+        """_safe_int over a whole column: Int64 (truncated), NA where missing."""
+        num = pd.to_numeric(self._column(name), errors="coerce")
+        return np.trunc(num).astype("Int64")
+
+    def _floats(self, name: str) -> list[float | None]:
+        num = pd.to_numeric(self._column(name), errors="coerce")
+        return _nullable(num)
+
+    def _strs(self, name: str) -> pd.Series:
+        """_safe_str over a whole column: stripped text, None when missing/blank."""
+        col = self._column(name)
+        text = col.astype(str).str.strip()
+        return text.where(col.notna() & (text != ""), None)
+
+    def _normalize_all(self) -> list[GameState]:
+        """Normalise every play in one vectorised pass (same rules as per-row)."""
         # Resolve yard_line columns
-        yardline_100 = _safe_int(row.get("yardline_100"))
-        yard_line_from_own = (100 - yardline_100) if yardline_100 is not None else None
+        yardline_100 = self._ints("yardline_100")
+        yard_line_from_own = 100 - yardline_100
 
         # Score — always home perspective (consistent with training labels)
-        score_home = _safe_int(row.get("total_home_score")) or 0
-        score_away = _safe_int(row.get("total_away_score")) or 0
-        score_differential = score_home - score_away
+        score_home = self._ints("total_home_score").fillna(0)
+        score_away = self._ints("total_away_score").fillna(0)
 
-        # Clock
-        game_secs = _safe_int(row.get("game_seconds_remaining")) or 0
-        half_secs = _safe_int(row.get("half_seconds_remaining")) or 0
-        game_clock_secs = _safe_int(row.get("quarter_seconds_remaining")) or 0
-
-        # Yards to go (nflfastR uses "ydstogo" historically)
-        yards_to_go = _safe_int(row.get("yards_to_go")) or _safe_int(row.get("ydstogo"))
+        # Yards to go (nflfastR uses "ydstogo" historically); 0 falls through
+        # to ydstogo like the `or` chain it replaces
+        ytg = self._ints("yards_to_go")
+        yards_to_go = ytg.where(ytg.notna() & (ytg != 0), self._ints("ydstogo"))
 
         # Possession features
-        posteam = _safe_str(row.get("posteam"))
-        home_team = _safe_str(row.get("home_team"))
-        posteam_is_home = int(
-            posteam is not None and home_team is not None and posteam == home_team
-        )
+        posteam = self._strs("posteam")
+        home_team = self._strs("home_team")
+        posteam_is_home = (
+            posteam.notna() & home_team.notna() & (posteam == home_team)
+        ).astype(int)
 
         # receive_2h_ko: 1 if the possession team will receive the 2nd-half kickoff.
         # Formula: home_opening_kickoff XOR posteam_is_home
         # (if home got the opening kick, away gets 2nd half; if away got it, home gets 2nd half)
-        home_opening_kickoff = _safe_int(row.get("home_opening_kickoff")) or 0
-        receive_2h_ko = int(home_opening_kickoff != posteam_is_home)
-
-        return GameState(
-            game_id=self._nflfastr_game_id,
-            play_number=int(row.name) + 1,
-            sequence=sequence,
-            quarter=_safe_int(row.get("qtr")) or 1,
-            game_clock_seconds=game_clock_secs,
-            down=_safe_int(row.get("down")),
-            yards_to_go=yards_to_go,
-            yardline_100=yardline_100,
-            yard_line_from_own=yard_line_from_own,
-            score_home=score_home,
-            score_away=score_away,
-            score_differential=score_differential,
-            posteam_abbr=posteam,
-            defteam_abbr=_safe_str(row.get("defteam")),
-            posteam_is_home=posteam_is_home,
-            receive_2h_ko=receive_2h_ko,
-            posteam_timeouts_remaining=_safe_int(row.get("posteam_timeouts_remaining")) or 3,
-            defteam_timeouts_remaining=_safe_int(row.get("defteam_timeouts_remaining")) or 3,
-            game_seconds_remaining=game_secs,
-            half_seconds_remaining=half_secs,
-            spread_line=_safe_float(row.get("spread_line")),
-            ep=_safe_float(row.get("ep")),
-            play_type=_safe_str(row.get("play_type")),
-            description=_safe_str(row.get("desc")),
-            raw_payload=row.to_dict(),
-        )
+        home_opening_kickoff = self._ints("home_opening_kickoff").fillna(0)
+        receive_2h_ko = (home_opening_kickoff != posteam_is_home).astype(int)
+
+        # Timeouts: 0 and missing both read as 3, as before
+        pos_to = self._ints("posteam_timeouts_remaining")
+        def_to = self._ints("defteam_timeouts_remaining")
+
+        columns = {
+            "quarter": _nonzero_or(self._ints("qtr"), 1),
+            "game_clock_seconds": _nonzero_or(self._ints("quarter_seconds_remaining"), 0),
+            "down": _nullable(self._ints("down")),
+            "yards_to_go": _nullable(yards_to_go),
+            "yardline_100": _nullable(yardline_100),
+            "yard_line_from_own": _nullable(yard_line_from_own),
+            "score_home": _nullable(score_home),
+            "score_away": _nullable(score_away),
+            "score_differential": _nullable(score_home - score_away),
+            "posteam_abbr": posteam.tolist(),
+            "defteam_abbr": self._strs("defteam").tolist(),
+            "posteam_is_home": posteam_is_home.tolist(),
+            "receive_2h_ko": receive_2h_ko.tolist(),
+            "posteam_timeouts_remaining": _nonzero_or(pos_to, 3),
+            "defteam_timeouts_remaining": _nonzero_or(def_to, 3),
+            "game_seconds_remaining": _nonzero_or(self._ints("game_seconds_remaining"), 0),
+            "half_seconds_remaining": _nonzero_or(self._ints("half_seconds_remaining"), 0),
+            "spread_line": self._floats("spread_line"),
+            "ep": self._floats("ep"),
+            "play_type": self._strs("play_type").tolist(),
+            "description": self._strs("desc").tolist(),
+        }
+
+        # One dict(zip()) per play; no keyword-argument or intermediate dicts
+        n = len(self._df)
+        names = ["game_id", "play_number", "sequence", *columns]
+        return [
+            dict(zip(names, values))
+            for values in zip(
+                repeat(self._nflfastr_game_id, n), range(1, n + 1), range(n), *columns.values()
+            )
+        ]
 
     async def stream_plays(self, game_id: str) -> AsyncIterator[GameState]:  # type: ignore[override]
         delay = 1.0 / self._speed
-        for seq, (_, row) in enumerate(self._df.iterrows()):
-            yield self._normalize(row, sequence=seq)
+        # raw_payload is built per play as it streams rather than held for the
+        # whole game; most of the ~370 nflfastR columns are empty on any given
+        # play and play_raw never stored NaN, so those cells are skipped here.
+        names = self._df.columns.tolist()
+        rows = self._df.itertuples(index=False, name=None)
+        for state, row in zip(self._states, rows):
+            payload = {k: v for k, v in zip(names, row) if v == v}
+            yield {**state, "raw_payload": payload}
             await asyncio.sleep(delay)
 
     async def get_game_metadata(self, game_id: str) -> dict:
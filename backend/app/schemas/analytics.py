@@ -2,6 +2,7 @@
   - Momentum Swings
   - Clutch Index
   - Coach Decision Grades
+and the combined response that bundles all three.
 """
 from __future__ import annotations
 
@@ -101,3 +102,14 @@ class CoachDecision(BaseModel):
 class DecisionGradesResponse(BaseModel):
     game_id: uuid.UUID
     decisions: list[CoachDecision]
+
+
+# ---------------------------------------------------------------------------
+# Combined
+# ---------------------------------------------------------------------------
+
+class GameAnalyticsResponse(BaseModel):
+    game_id: uuid.UUID
+    momentum_swings: MomentumSwingsResponse
+    clutch: ClutchResponse
+    decision_grades: DecisionGradesResponse
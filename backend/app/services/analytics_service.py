@@ -6,14 +6,22 @@ so DB I/O is done once and re-used across all three computations.
 """
 from __future__ import annotations
 
+import asyncio
+import bisect
+import functools
+import heapq
+import logging
 import math
 import uuid
+from dataclasses import dataclass
 from typing import Literal
 
+import numpy as np
 from fastapi import HTTPException
-from sqlalchemy import select
+from pydantic import BaseModel
+from redis.exceptions import RedisError
+from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
 
 from app.db.models.game import Game
 from app.db.models.play import Play
@@ -26,10 +34,14 @@ from app.schemas.analytics import (
     CoachDecision,
     DecisionGradesResponse,
     DecisionOption,
+    GameAnalyticsResponse,
     MomentumSwing,
     MomentumSwingsResponse,
     PlayRef,
 )
+from app.utils.cache import cache_enabled, get_analytics_result, set_analytics_result
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Constants / tunables
@@ -42,6 +54,7 @@ _JUNK_PLAY_TYPES = {"no_play", "qb_kneel", "qb_spike", "timeout",
 # Descriptions that mark administrative end-of-period rows (not real plays)
 _JUNK_DESC_PREFIXES = ("end quarter", "end game", "end of game", "end half",
                        "two-minute warning", "end of half")
+_JUNK_DESC_PREFIX_LEN = max(map(len, _JUNK_DESC_PREFIXES))
 
 # Clutch formula parameters
 _T_THRESHOLD = 900   # seconds remaining when "clutch window" starts (last ~15 min)
@@ -69,19 +82,35 @@ _CONV_RATE: dict[tuple[int, int], float] = {
 
 # FG make probability by kick distance (yards)
 # Approximated with a logistic curve
-def _fg_make_prob(kick_distance: float) -> float:
-    """P(FG made) given kick distance in yards."""
+def _fg_logistic(kick_distance: float) -> float:
     # Logistic curve calibrated to NFL averages:
     # 20 yd ≈ 0.98, 40 yd ≈ 0.87, 50 yd ≈ 0.72, 60 yd ≈ 0.52
     return 1.0 / (1.0 + math.exp(0.10 * (kick_distance - 37)))
 
 
+# Kick distances are whole yards in practice, so those are tabulated exactly
+_FG_PROB_LUT: list[float] = [_fg_logistic(d) for d in range(121)]
+
+
+def _fg_make_prob(kick_distance: float) -> float:
+    """P(FG made) given kick distance in yards."""
+    if isinstance(kick_distance, int) and 0 <= kick_distance < len(_FG_PROB_LUT):
+        return _FG_PROB_LUT[kick_distance]
+    return _fg_logistic(kick_distance)
+
+
+# _CONV_RATE flattened to one entry per yards_to_go (0..99); 0.22 outside the buckets
+_CONV_TABLE: list[float] = [
+    next((rate for (lo, hi), rate in _CONV_RATE.items() if lo <= ydg <= hi), 0.22)
+    for ydg in range(100)
+]
+
+
 def _conv_prob(yards_to_go: int | None) -> float:
     """P(4th-down conversion) given yards_to_go."""
     ydg = yards_to_go if yards_to_go is not None else 10
-    for (lo, hi), rate in _CONV_RATE.items():
-        if lo <= ydg <= hi:
-            return rate
+    if 0 <= ydg < len(_CONV_TABLE):
+        return _CONV_TABLE[ydg]
     return 0.22  # very long
 
 
@@ -105,10 +134,9 @@ def _is_junk_play(play: Play) -> bool:
     # play_type is None for end-of-game / end-of-half administrative rows
     if play.play_type is None:
         return True
-    desc = (play.description or "").lower()
-    if any(desc.startswith(prefix) for prefix in _JUNK_DESC_PREFIXES):
-        return True
-    return False
+    # Only the head of the description can match a prefix, so only it is lowered
+    desc = (play.description or "")[:_JUNK_DESC_PREFIX_LEN].lower()
+    return desc.startswith(_JUNK_DESC_PREFIXES)
 
 
 # ---------------------------------------------------------------------------
@@ -117,36 +145,94 @@ def _is_junk_play(play: Play) -> bool:
 
 async def _load_plays_with_wp(
     db: AsyncSession, game_id: uuid.UUID
-) -> list[tuple[Play, WpPrediction]]:
-    """Return sorted (Play, WpPrediction) pairs for a game.
+) -> tuple[list[tuple[Play, WpPrediction]], uuid.UUID | None]:
+    """Return sorted (Play, WpPrediction) pairs for a game, plus the game's
+    home_team_id (None when there are no pairs).
     Only plays that have at least one WP prediction are included.
     Raises 404 if game not found.
     """
-    game_result = await db.execute(select(Game).where(Game.id == game_id))
-    if game_result.scalar_one_or_none() is None:
-        raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-
+    # Latest prediction per play, picked in SQL with DISTINCT ON; the game's
+    # home_team_id rides along so clutch needn't look it up separately
     stmt = (
-        select(Play)
+        select(Play, WpPrediction, Game.home_team_id)
+        .join(WpPrediction, WpPrediction.play_id == Play.id)
+        .join(Game, Game.id == Play.game_id)
         .where(Play.game_id == game_id)
-        .options(selectinload(Play.wp_predictions))
-        .order_by(Play.sequence)
+        .distinct(Play.sequence, Play.id)
+        .order_by(Play.sequence, Play.id, WpPrediction.predicted_at.desc())
     )
-    result = await db.execute(stmt)
-    plays = result.scalars().all()
+    rows = (await db.execute(stmt)).all()
 
-    pairs: list[tuple[Play, WpPrediction]] = []
-    for play in plays:
-        if not play.wp_predictions:
-            continue
-        wp = max(play.wp_predictions, key=lambda p: p.predicted_at)
-        pairs.append((play, wp))
+    # Only an empty result needs the extra round-trip to tell "no predictions"
+    # apart from "no such game"
+    if not rows:
+        game_result = await db.execute(select(Game.id).where(Game.id == game_id))
+        if game_result.scalar_one_or_none() is None:
+            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
+        return [], None
+
+    return [(play, wp) for play, wp, _ in rows], rows[0][2]
 
-    return pairs
 
+async def _wp_signature(db: AsyncSession, game_id: uuid.UUID) -> str | None:
+    """Cheap fingerprint of a game's plays + predictions, or None if it has none.
 
+    Changes whenever a play or prediction is added (replays, model re-runs), so
+    cached analytics for a finished game are reused and live games recompute.
+    """
+    row = (
+        await db.execute(
+            select(
+                func.count(WpPrediction.id),
+                func.max(Play.sequence),
+                func.max(WpPrediction.predicted_at),
+            )
+            .join_from(Play, WpPrediction, WpPrediction.play_id == Play.id)
+            .where(Play.game_id == game_id)
+        )
+    ).one()
+    n, max_seq, last_at = row
+    if not n:
+        return None
+    return f"{n}:{max_seq}:{last_at.timestamp()}"
+
+
+def _cached(response_model: type[BaseModel]):
+    """Cache an analytics coroutine's response in Redis, keyed by game, params
+    and the game's _wp_signature. A no-op when Redis isn't configured."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(db: AsyncSession, game_id: uuid.UUID, **params):
+            if not cache_enabled():
+                return await fn(db, game_id, **params)
+            sig = await _wp_signature(db, game_id)
+            if sig is None:
+                # Nothing to cache; let fn produce the empty result / 404
+                return await fn(db, game_id, **params)
+            args = ",".join(f"{k}={v}" for k, v in sorted(params.items()))
+            key = f"{fn.__name__}:{game_id}:{args}:{sig}"
+            # Redis is only a cache here: on any Redis failure, log and compute
+            try:
+                cached = await get_analytics_result(key)
+            except RedisError:
+                logger.warning("Analytics cache read failed for %s", key, exc_info=True)
+                cached = None
+            if cached is not None:
+                return response_model.model_validate_json(cached)
+            result = await fn(db, game_id, **params)
+            try:
+                await set_analytics_result(key, result.model_dump_json().encode())
+            except RedisError:
+                logger.warning("Analytics cache write failed for %s", key, exc_info=True)
+            return result
+        return wrapper
+    return decorator
+
+
+# Result schemas below are built with model_construct: every field comes from
+# ORM columns or values computed here, so per-field validation is skipped.
 def _play_ref(play: Play) -> PlayRef:
-    return PlayRef(
+    return PlayRef.model_construct(
         play_id=play.id,
         sequence=play.sequence,
         quarter=play.quarter,
@@ -155,6 +241,47 @@ def _play_ref(play: Play) -> PlayRef:
     )
 
 
+@dataclass(slots=True)
+class _PlayArrays:
+    """Column arrays over a game's (Play, WpPrediction) pairs, index-aligned."""
+    home_wp: np.ndarray
+    quarter: np.ndarray
+    game_clock_seconds: np.ndarray
+    score_home: np.ndarray
+    score_away: np.ndarray
+    down: np.ndarray          # -1 where unknown
+    junk: np.ndarray          # _is_junk_play, as a bool mask
+    posteam_id: list[uuid.UUID | None]
+    delta: np.ndarray         # ΔWP vs the previous pair (home perspective); 0 for the first
+    scored: np.ndarray        # indices of plays that get a ΔWP (non-junk, not the first)
+
+
+def _play_arrays(pairs: list[tuple[Play, WpPrediction]]) -> _PlayArrays:
+    plays = [play for play, _ in pairs]
+    home_wp = np.array([wp.home_wp for _, wp in pairs], dtype=np.float64)
+    junk = np.array([_is_junk_play(p) for p in plays], dtype=bool)
+    # Game-state columns are small integers, so int32 holds them exactly; WP
+    # stays float64 because deltas are returned unrounded
+    return _PlayArrays(
+        home_wp=home_wp,
+        quarter=np.array([p.quarter for p in plays], dtype=np.int32),
+        game_clock_seconds=np.array([p.game_clock_seconds for p in plays], dtype=np.int32),
+        score_home=np.array([p.score_home for p in plays], dtype=np.int32),
+        score_away=np.array([p.score_away for p in plays], dtype=np.int32),
+        down=np.array([-1 if p.down is None else p.down for p in plays], dtype=np.int32),
+        junk=junk,
+        posteam_id=[p.posteam_id for p in plays],
+        # Junk plays get no delta of their own but still reset the baseline
+        delta=np.diff(home_wp, prepend=home_wp[:1]),
+        scored=np.flatnonzero(~junk[1:]) + 1,
+    )
+
+
+def _ranked(candidates: np.ndarray, scores: np.ndarray) -> np.ndarray:
+    """candidates ordered by score descending; ties keep sequence order."""
+    return candidates[np.argsort(-scores, kind="stable")]
+
+
 # ---------------------------------------------------------------------------
 # 1. Momentum Swings
 # ---------------------------------------------------------------------------
@@ -173,48 +300,41 @@ def _tag_play(play: Play, delta_wp: float) -> str | None:
     return None
 
 
+@_cached(MomentumSwingsResponse)
 async def get_momentum_swings(
     db: AsyncSession, game_id: uuid.UUID, top: int = 3
 ) -> MomentumSwingsResponse:
-    pairs = await _load_plays_with_wp(db, game_id)
+    pairs, _ = await _load_plays_with_wp(db, game_id)
+    return _momentum_swings(game_id, pairs, _play_arrays(pairs), top)
+
 
+def _momentum_swings(
+    game_id: uuid.UUID,
+    pairs: list[tuple[Play, WpPrediction]],
+    arr: _PlayArrays,
+    top: int,
+) -> MomentumSwingsResponse:
     if len(pairs) < 2:
         return MomentumSwingsResponse(game_id=game_id, swings=[])
 
-    # Compute ΔWP for each play (always from home-team perspective)
-    deltas: list[tuple[float, float, float, Play, WpPrediction]] = []
-    prev_wp = pairs[0][1].home_wp
-
-    for play, wp in pairs[1:]:
-        if _is_junk_play(play):
-            prev_wp = wp.home_wp
-            continue
-        delta = wp.home_wp - prev_wp
-        deltas.append((abs(delta), delta, prev_wp, play, wp))
-        prev_wp = wp.home_wp
-
-    # Sort by magnitude descending, take top N
-    deltas.sort(key=lambda x: x[0], reverse=True)
-    top_deltas = deltas[:top]
-    # Re-sort by sequence for consistent ordering
-    top_deltas.sort(key=lambda x: x[3].sequence)
-
-    swings: list[MomentumSwing] = []
-    for rank, (magnitude, delta, wp_before, play, wp) in enumerate(
-        sorted(top_deltas, key=lambda x: x[0], reverse=True), start=1
-    ):
-        swings.append(
-            MomentumSwing(
-                rank=rank,
-                play_ref=_play_ref(play),
-                wp_before=wp_before,
-                wp_after=wp.home_wp,
-                delta_wp=delta,
-                magnitude=magnitude,
-                tag=_tag_play(play, delta),
-                is_turning_point=(rank == 1),
-            )
+    # ΔWP for each play (always from home-team perspective)
+    top_idx = _ranked(arr.scored, np.abs(arr.delta[arr.scored]))[:top]
+
+    swings = [
+        MomentumSwing.model_construct(
+            rank=rank,
+            play_ref=_play_ref(pairs[i][0]),
+            wp_before=pairs[i - 1][1].home_wp,
+            wp_after=pairs[i][1].home_wp,
+            delta_wp=d,
+            magnitude=abs(d),
+            tag=_tag_play(pairs[i][0], d),
+            is_turning_point=(rank == 1),
         )
+        for rank, (i, d) in enumerate(
+            zip(top_idx.tolist(), arr.delta[top_idx].tolist()), start=1
+        )
+    ]
 
     return MomentumSwingsResponse(game_id=game_id, swings=swings)
 
@@ -223,16 +343,17 @@ async def get_momentum_swings(
 # 2. Clutch Index
 # ---------------------------------------------------------------------------
 
-def _sigmoid(x: float) -> float:
-    return 1.0 / (1.0 + math.exp(-x))
+# Time factor = sigmoid((_T_THRESHOLD - gsr) / _TAU), tabulated over whole
+# game seconds remaining (regulation, 0..3600)
+_MAX_GSR = 3600
+_TIME_FACTOR_LUT = 1.0 / (1.0 + np.exp(-((_T_THRESHOLD - np.arange(_MAX_GSR + 1)) / _TAU)))
 
 
-def _time_factor(game_seconds_remaining: int) -> float:
+def _time_factor(gsr: np.ndarray) -> np.ndarray:
     """Higher when closer to end of game."""
-    # game_clock_seconds is seconds remaining IN THE QUARTER; convert to full-game secs
-    # We store game_clock_seconds as quarter-level; compute game-level seconds remaining
-    # via the quarter field — but here we receive it already as game_seconds_remaining.
-    return _sigmoid(((_T_THRESHOLD - game_seconds_remaining) / _TAU))
+    if gsr.size and (gsr.min() < 0 or gsr.max() > _MAX_GSR):
+        return 1.0 / (1.0 + np.exp(-((_T_THRESHOLD - gsr) / _TAU)))
+    return _TIME_FACTOR_LUT[gsr]
 
 
 def _game_seconds_remaining(play: Play) -> int:
@@ -243,15 +364,23 @@ def _game_seconds_remaining(play: Play) -> int:
     return quarters_left * 900 + quarter_seconds_remaining
 
 
+@_cached(ClutchResponse)
 async def get_clutch_index(
     db: AsyncSession,
     game_id: uuid.UUID,
-    home_abbr: str,
-    away_abbr: str,
     top_plays: int = 5,
 ) -> ClutchResponse:
-    pairs = await _load_plays_with_wp(db, game_id)
+    pairs, home_team_id = await _load_plays_with_wp(db, game_id)
+    return _clutch_index(game_id, pairs, _play_arrays(pairs), home_team_id, top_plays)
 
+
+def _clutch_index(
+    game_id: uuid.UUID,
+    pairs: list[tuple[Play, WpPrediction]],
+    arr: _PlayArrays,
+    home_team_id: uuid.UUID | None,
+    top_plays: int,
+) -> ClutchResponse:
     if len(pairs) < 2:
         return ClutchResponse(
             game_id=game_id,
@@ -263,104 +392,86 @@ async def get_clutch_index(
             },
         )
 
-    clutch_plays: list[tuple[float, float, float, float, int, Play]] = []
-    prev_wp = pairs[0][1].home_wp
-
-    for play, wp in pairs[1:]:
-        if _is_junk_play(play):
-            prev_wp = wp.home_wp
-            continue
-        delta = wp.home_wp - prev_wp
-        magnitude = abs(delta)
-
-        gsr = _game_seconds_remaining(play)
-        tf = _time_factor(gsr)
-        score_diff = play.score_home - play.score_away
-        cf = math.exp(-abs(score_diff) / _K)
-
-        clutch = magnitude * tf * cf
-        clutch_plays.append((clutch, delta, tf, cf, score_diff, play))
-        prev_wp = wp.home_wp
-
-    # Top plays by clutch score
-    clutch_plays.sort(key=lambda x: x[0], reverse=True)
-    top_n = clutch_plays[:top_plays]
-
-    result_plays: list[ClutchPlay] = []
-    for rank, (clutch, delta, tf, cf, sdiff, play) in enumerate(top_n, start=1):
-        result_plays.append(
-            ClutchPlay(
-                rank=rank,
-                play_ref=_play_ref(play),
-                delta_wp=delta,
-                clutch_score=round(clutch, 4),
-                time_factor=round(tf, 4),
-                close_factor=round(cf, 4),
-                score_diff=sdiff,
-            )
+    # Per-play clutch = |ΔWP| × time factor × closeness factor, over non-junk plays
+    candidates = arr.scored
+    delta = arr.delta[candidates]
+    # Total game seconds remaining, from quarter + quarter clock (OT counts as Q4)
+    gsr = (4 - np.minimum(arr.quarter[candidates], 4)) * 900 + arr.game_clock_seconds[candidates]
+    tf = _time_factor(gsr)
+    score_diff = arr.score_home[candidates] - arr.score_away[candidates]
+    cf = np.exp(-np.abs(score_diff) / _K)
+    clutch = np.abs(delta) * tf * cf
+
+    # Positions into the candidate arrays, by clutch score descending
+    order = np.argsort(-clutch, kind="stable")
+
+    # Top rows pulled out as Python scalars in one go rather than per element
+    picked = order[:top_plays]
+    result_plays = [
+        ClutchPlay.model_construct(
+            rank=rank,
+            play_ref=_play_ref(pairs[i][0]),
+            delta_wp=d,
+            clutch_score=round(c, 4),
+            time_factor=round(t, 4),
+            close_factor=round(f, 4),
+            score_diff=sd,
+        )
+        for rank, (i, d, c, t, f, sd) in enumerate(
+            zip(
+                candidates[picked].tolist(),
+                delta[picked].tolist(),
+                clutch[picked].tolist(),
+                tf[picked].tolist(),
+                cf[picked].tolist(),
+                score_diff[picked].tolist(),
+            ),
+            start=1,
         )
+    ]
 
-    # Drive-level clutch aggregation (approximated by possession team flips)
+    # Drive-level clutch aggregation (approximated by possession team flips,
+    # walked in clutch-score order as before)
     drive_totals: list[tuple[int, str | None, float, int]] = []
     current_drive = 0
     current_posteam: uuid.UUID | None = None
     current_clutch = 0.0
     current_count = 0
 
-    for clutch, _, _, _, _, play in clutch_plays + [(0, 0, 0, 0, 0, None)]:  # type: ignore[list-item]
-        if play is None:
-            if current_count > 0:
-                drive_totals.append((current_drive, None, current_clutch, current_count))
-            break
-        if play.posteam_id != current_posteam:
+    for k in order.tolist():
+        posteam_id = arr.posteam_id[candidates[k]]
+        if posteam_id != current_posteam:
             if current_count > 0:
                 drive_totals.append((current_drive, None, current_clutch, current_count))
             current_drive += 1
-            current_posteam = play.posteam_id
+            current_posteam = posteam_id
             current_clutch = 0.0
             current_count = 0
-        current_clutch += clutch
+        current_clutch += float(clutch[k])
         current_count += 1
+    if current_count > 0:
+        drive_totals.append((current_drive, None, current_clutch, current_count))
 
-    drive_totals.sort(key=lambda x: x[2], reverse=True)
     top_drives = [
-        ClutchDrive(
+        ClutchDrive.model_construct(
             drive_number=dn,
             posteam_abbr=None,  # enriched by endpoint if needed
             clutch_total=round(ct, 4),
             play_count=pc,
         )
-        for dn, _, ct, pc in drive_totals[:5]
+        for dn, _, ct, pc in heapq.nlargest(5, drive_totals, key=lambda x: x[2])
     ]
 
     # Team clutch totals — derive from posteam_id vs home/away
-    # We need home_team_id & away_team_id; fetch from game
-    game_result = await db.execute(
-        select(Game).where(Game.id == game_id)
+    # Offense credit goes to the posteam if delta favours it (positive delta is
+    # good for home); otherwise the other side's defense gets the credit.
+    is_home_pos = np.array(
+        [arr.posteam_id[i] == home_team_id for i in candidates.tolist()], dtype=bool
     )
-    game = game_result.scalar_one()
-
-    home_offense = 0.0
-    home_defense = 0.0
-    away_offense = 0.0
-    away_defense = 0.0
-
-    for clutch, delta, _, _, _, play in clutch_plays:
-        is_home_pos = play.posteam_id == game.home_team_id
-        # Offense credit: posteam gains WP (delta > 0 for home, delta < 0 for away means away offense won)
-        # From home perspective: positive delta = home offense or away defense stop
-        # Simple split: credit posteam if delta favours them
-        if is_home_pos:
-            if delta > 0:
-                home_offense += clutch
-            else:
-                # Home offense fumbled/turned over — away defense gets credit
-                away_defense += clutch
-        else:
-            if delta < 0:  # away team gained WP
-                away_offense += clutch
-            else:
-                home_defense += clutch
+    home_offense = float(clutch[is_home_pos & (delta > 0)].sum())
+    away_defense = float(clutch[is_home_pos & (delta <= 0)].sum())
+    away_offense = float(clutch[~is_home_pos & (delta < 0)].sum())
+    home_defense = float(clutch[~is_home_pos & (delta >= 0)].sum())
 
     return ClutchResponse(
         game_id=game_id,
@@ -402,15 +513,28 @@ def _situation_string(play: Play) -> str:
     return f"4th & {ydg} at {field}"
 
 
+_PT_TO_ACTUAL: dict[str, Literal["go_for_it", "punt", "field_goal"]] = {
+    "punt": "punt",
+    "field_goal": "field_goal",
+    "fg": "field_goal",
+    "run": "go_for_it",
+    "pass": "go_for_it",
+    "qb_scramble": "go_for_it",
+    "pass_incomplete": "go_for_it",
+    "pass_complete": "go_for_it",
+}
+
+
 def _classify_actual(play: Play) -> Literal["go_for_it", "punt", "field_goal"] | None:
     pt = (play.play_type or "").lower()
-    desc = (play.description or "").lower()
-    if pt == "punt":
-        return "punt"
-    if pt in ("field_goal", "fg") or "field goal" in desc:
+    actual = _PT_TO_ACTUAL.get(pt)
+    if actual == "punt" or actual == "field_goal":
+        return actual
+    # A "field goal" description wins over a go-for-it play type (fakes, etc.)
+    if "field goal" in (play.description or "").lower():
         return "field_goal"
-    if pt in ("run", "pass", "qb_scramble", "pass_incomplete", "pass_complete"):
-        return "go_for_it"
+    if actual is not None:
+        return actual
     # Also classify scrambles and rush attempts on 4th
     if "pass" in pt or "rush" in pt or "run" in pt:
         return "go_for_it"
@@ -418,21 +542,26 @@ def _classify_actual(play: Play) -> Literal["go_for_it", "punt", "field_goal"] |
 
 
 def _wp_for_state(
-    pairs_lookup: dict[int, tuple[Play, WpPrediction]],
+    pairs: list[tuple[Play, WpPrediction]],
+    sequences: list[int],
     target_sequence: int,
 ) -> float | None:
-    """Look up the WP at a given sequence in the play log (approximate next state)."""
-    # Find the nearest play at or after target_sequence
-    candidates = [s for s in pairs_lookup if s >= target_sequence]
-    if not candidates:
+    """Look up the WP at a given sequence in the play log (approximate next state).
+
+    ``sequences`` is the sorted sequence column of ``pairs``.
+    """
+    # Nearest play at or after target_sequence
+    i = bisect.bisect_left(sequences, target_sequence)
+    if i == len(sequences):
         return None
-    return pairs_lookup[min(candidates)][1].home_wp
+    return pairs[i][1].home_wp
 
 
 def _build_counterfactuals(
     play: Play,
     wp_before: float,
-    pairs_lookup: dict[int, tuple[Play, WpPrediction]],
+    pairs: list[tuple[Play, WpPrediction]],
+    sequences: list[int],
     actual_type: Literal["go_for_it", "punt", "field_goal"],
 ) -> dict[str, DecisionOption | None]:
     """
@@ -450,8 +579,6 @@ def _build_counterfactuals(
     yl = play.yard_line_from_own  # 0-50 from OWN end zone (stored as yard_line_from_own)
     ydg = play.yards_to_go or 10
     p_conv = _conv_prob(ydg)
-    gsr = _game_seconds_remaining(play)
-    time_pressure = 1.0 - gsr / 3600.0  # 0 at kickoff, 1 at final whistle
 
     # yardline_100 = distance from OPPONENT end zone (1–99)
     # yard_line_from_own is 0–50 from own end zone, so yardline_100 ≈ 100 - yl - 50 = 50 - yl
@@ -478,7 +605,7 @@ def _build_counterfactuals(
     wp_success = min(wp_before + success_gain, 0.97)
     wp_fail    = max(wp_before - fail_loss, 0.03)
     wp_go = p_conv * wp_success + (1 - p_conv) * wp_fail
-    alternatives["go_for_it"] = DecisionOption(
+    alternatives["go_for_it"] = DecisionOption.model_construct(
         wp=round(wp_go, 4),
         detail=f"p_conv={p_conv:.0%}",
     )
@@ -496,7 +623,7 @@ def _build_counterfactuals(
         wp_punt = max(min(0.50 + field_pos_benefit * (1 if wp_before >= 0.50 else -1), 0.75), 0.25)
         # Blend with wp_before to avoid huge jumps
         wp_punt = 0.4 * wp_punt + 0.6 * wp_before
-        alternatives["punt"] = DecisionOption(
+        alternatives["punt"] = DecisionOption.model_construct(
             wp=round(wp_punt, 4),
             detail=f"expected_net={net_yards} yds",
         )
@@ -509,6 +636,9 @@ def _build_counterfactuals(
     if yardline_100 is not None and yardline_100 <= 52:
         kick_dist = yardline_100 + 17  # snap depth + end zone
         p_fg = _fg_make_prob(kick_dist)
+        # Clock only matters to the FG estimate, so it's computed inside its range check
+        gsr = _game_seconds_remaining(play)
+        time_pressure = 1.0 - gsr / 3600.0  # 0 at kickoff, 1 at final whistle
         score_diff = play.score_home - play.score_away
         # Made: +3 pts, kickoff → roughly symmetric possession flip with good field pos
         # How much +3 helps depends on current score_diff and time remaining
@@ -520,7 +650,7 @@ def _build_counterfactuals(
         miss_penalty = 0.04 + 0.06 * time_pressure
         wp_fg_miss = max(wp_before - miss_penalty, 0.05)
         wp_fg = p_fg * wp_fg_made + (1 - p_fg) * wp_fg_miss
-        alternatives["field_goal"] = DecisionOption(
+        alternatives["field_goal"] = DecisionOption.model_construct(
             wp=round(wp_fg, 4),
             detail=f"p_make={p_fg:.0%}, dist={kick_dist} yds",
         )
@@ -530,46 +660,47 @@ def _build_counterfactuals(
     return alternatives
 
 
+@_cached(DecisionGradesResponse)
 async def get_decision_grades(
     db: AsyncSession,
     game_id: uuid.UUID,
     top: int = 10,
 ) -> DecisionGradesResponse:
-    pairs = await _load_plays_with_wp(db, game_id)
+    pairs, _ = await _load_plays_with_wp(db, game_id)
+    return _decision_grades(game_id, pairs, _play_arrays(pairs), top)
+
 
+def _decision_grades(
+    game_id: uuid.UUID,
+    pairs: list[tuple[Play, WpPrediction]],
+    arr: _PlayArrays,
+    top: int,
+) -> DecisionGradesResponse:
     if len(pairs) < 2:
         return DecisionGradesResponse(game_id=game_id, decisions=[])
 
-    # Build a sequence→(play, wp) lookup for counterfactual next-state WP
-    pairs_lookup: dict[int, tuple[Play, WpPrediction]] = {
-        play.sequence: (play, wp) for play, wp in pairs
-    }
+    # Pairs are in sequence order; the sorted column lets _wp_for_state bisect
+    sequences = [play.sequence for play, _ in pairs]
 
-    decisions: list[CoachDecision] = []
-    prev_wp = pairs[0][1].home_wp
+    # Only 4th downs that aren't junk / administrative plays (including None
+    # play_type end markers) are graded; WP before a play is the previous pair's.
+    candidates = np.flatnonzero((arr.down == 4) & ~arr.junk)
 
-    for play, wp in pairs:
-        # Only grade 4th downs (down == 4)
-        if play.down != 4:
-            prev_wp = wp.home_wp
-            continue
+    decisions: list[CoachDecision] = []
+    for i in candidates.tolist():
+        play, wp = pairs[i]
+        prev_wp = pairs[max(i - 1, 0)][1].home_wp
 
-        # Skip all junk / administrative plays (including None play_type end markers)
-        if _is_junk_play(play):
-            prev_wp = wp.home_wp
-            continue
         # Skip end-of-game kneels / victory-formation plays
         desc = (play.description or "").lower()
         if "kneel" in desc or "victory" in desc:
-            prev_wp = wp.home_wp
             continue
 
         actual_type = _classify_actual(play)
         if actual_type is None:
-            prev_wp = wp.home_wp
             continue
 
-        alternatives = _build_counterfactuals(play, prev_wp, pairs_lookup, actual_type)
+        alternatives = _build_counterfactuals(play, prev_wp, pairs, sequences, actual_type)
 
         # Get WP values for valid alternatives
         valid_wps: dict[str, float] = {}
@@ -578,7 +709,6 @@ async def get_decision_grades(
                 valid_wps[action] = opt.wp
 
         if not valid_wps:
-            prev_wp = wp.home_wp
             continue
 
         best_action = max(valid_wps, key=lambda a: valid_wps[a])
@@ -589,7 +719,7 @@ async def get_decision_grades(
         grade_label, grade_emoji = _grade(decision_delta)
 
         decisions.append(
-            CoachDecision(
+            CoachDecision.model_construct(
                 play_ref=_play_ref(play),
                 situation=_situation_string(play),
                 actual_type=actual_type,
@@ -597,13 +727,46 @@ async def get_decision_grades(
                 alternatives=alternatives,
                 best_action=best_action,
                 decision_delta=round(decision_delta, 4),
-                grade=grade_label,  # type: ignore[arg-type]
+                grade=grade_label,
                 grade_emoji=grade_emoji,
             )
         )
-        prev_wp = wp.home_wp
 
-    # Sort by leverage: abs(best_wp - worst alternative) or by abs(decision_delta)
-    decisions.sort(key=lambda d: abs(d.decision_delta), reverse=True)
+    # Top by leverage: abs(decision_delta)
+    top_decisions = heapq.nlargest(top, decisions, key=lambda d: abs(d.decision_delta))
+
+    return DecisionGradesResponse(game_id=game_id, decisions=top_decisions)
+
 
-    return DecisionGradesResponse(game_id=game_id, decisions=decisions[:top])
+# ---------------------------------------------------------------------------
+# All three in one pass
+# ---------------------------------------------------------------------------
+
+@_cached(GameAnalyticsResponse)
+async def get_game_analytics(
+    db: AsyncSession,
+    game_id: uuid.UUID,
+    top_swings: int = 3,
+    top_clutch: int = 5,
+    top_decisions: int = 10,
+) -> GameAnalyticsResponse:
+    """Momentum, clutch and decision grades from one load of the game's plays."""
+    pairs, home_team_id = await _load_plays_with_wp(db, game_id)
+    arr = _play_arrays(pairs)
+    # The three only read the loaded plays, so they run off the event loop side by side
+    async with asyncio.TaskGroup() as tg:
+        swings = tg.create_task(
+            asyncio.to_thread(_momentum_swings, game_id, pairs, arr, top_swings)
+        )
+        clutch = tg.create_task(
+            asyncio.to_thread(_clutch_index, game_id, pairs, arr, home_team_id, top_clutch)
+        )
+        grades = tg.create_task(
+            asyncio.to_thread(_decision_grades, game_id, pairs, arr, top_decisions)
+        )
+    return GameAnalyticsResponse(
+        game_id=game_id,
+        momentum_swings=swings.result(),
+        clutch=clutch.result(),
+        decision_grades=grades.result(),
+    )
@@ -16,6 +16,35 @@ from app.ml.features import FEATURE_DISPLAY_NAMES
 from app.schemas.game import GameDetail, GameRead
 from app.schemas.play import PlayRead, PlayWpRead
 from app.schemas.shap import ShapFeature
+from app.schemas.team import TeamRead
+
+# Same cut as the live SSE stream (ShapService.explain top_n)
+TOP_SHAP_N = 5
+
+# Read schemas are filled straight from ORM attributes with model_construct:
+# the columns are already typed, so per-field validation is skipped.
+_TEAM_FIELDS = tuple(TeamRead.model_fields)
+_GAME_FIELDS = tuple(
+    f for f in GameRead.model_fields
+    if f not in ("home_team", "away_team", "home_wp", "away_wp")
+)
+_PLAY_FIELDS = tuple(PlayRead.model_fields)
+
+
+def _team_read(team) -> TeamRead:
+    return TeamRead.model_construct(**{f: getattr(team, f) for f in _TEAM_FIELDS})
+
+
+def _game_read(game: Game) -> GameRead:
+    return GameRead.model_construct(
+        home_team=_team_read(game.home_team),
+        away_team=_team_read(game.away_team),
+        **{f: getattr(game, f) for f in _GAME_FIELDS},
+    )
+
+
+def _play_fields(play: Play) -> dict:
+    return {f: getattr(play, f) for f in _PLAY_FIELDS}
 
 
 class GameService:
@@ -58,7 +87,7 @@ class GameService:
 
         result = await self._db.execute(stmt)
         games = result.scalars().all()
-        return [GameRead.model_validate(g) for g in games]
+        return [_game_read(g) for g in games]
 
     async def get_game(self, game_id: UUID) -> GameDetail:
         stmt = (
@@ -81,42 +110,39 @@ class GameService:
         detail.play_count = play_count
         return detail
 
-    async def list_plays(self, game_id: UUID) -> list[PlayRead]:
-        # Verify game exists
-        game_result = await self._db.execute(select(Game).where(Game.id == game_id))
+    async def _ensure_game(self, game_id: UUID) -> None:
+        """404 unless the game exists. Callers only ask when their main query
+        came back empty, so the common path costs no extra round-trip."""
+        game_result = await self._db.execute(select(Game.id).where(Game.id == game_id))
         if game_result.scalar_one_or_none() is None:
             raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
 
+    async def list_plays(self, game_id: UUID) -> list[PlayRead]:
         stmt = select(Play).where(Play.game_id == game_id).order_by(Play.sequence)
         result = await self._db.execute(stmt)
         plays = result.scalars().all()
-        return [PlayRead.model_validate(p) for p in plays]
+        if not plays:
+            await self._ensure_game(game_id)
+        return [PlayRead.model_construct(**_play_fields(p)) for p in plays]
 
     async def list_plays_with_wp(self, game_id: UUID) -> list[PlayWpRead]:
         """Return plays joined with their WP predictions and SHAP values, sorted by sequence."""
-        game_result = await self._db.execute(select(Game).where(Game.id == game_id))
-        if game_result.scalar_one_or_none() is None:
-            raise HTTPException(status_code=404, detail=f"Game {game_id} not found")
-
-        # Load plays with their latest WP prediction and that prediction's SHAP values
+        # Plays with their latest WP prediction (DISTINCT ON picks it in SQL)
         stmt = (
-            select(Play)
+            select(Play, WpPrediction)
+            .join(WpPrediction, WpPrediction.play_id == Play.id)
             .where(Play.game_id == game_id)
-            .options(
-                selectinload(Play.wp_predictions).selectinload(WpPrediction.shap_values),
-            )
-            .order_by(Play.sequence)
+            .distinct(Play.sequence, Play.id)
+            .order_by(Play.sequence, Play.id, WpPrediction.predicted_at.desc())
         )
-        result = await self._db.execute(stmt)
-        plays = result.scalars().all()
+        pairs = (await self._db.execute(stmt)).all()
+        if not pairs:
+            await self._ensure_game(game_id)
+            return []
+        shap_by_wp = await self._top_shap([wp.id for _, wp in pairs])
 
         out: list[PlayWpRead] = []
-        for play in plays:
-            if not play.wp_predictions:
-                continue
-            # Use the most recent prediction for this play
-            wp = max(play.wp_predictions, key=lambda p: p.predicted_at)
-
+        for play, wp in pairs:
             home_wp = wp.home_wp
             away_wp = wp.away_wp
 
@@ -128,27 +154,51 @@ class GameService:
                 home_wp = 1.0 if score_diff > 0 else 0.0
                 away_wp = 1.0 - home_wp
 
-            top_shap = sorted(
-                [
-                    ShapFeature.from_raw(
-                        feature_name=sv.feature_name,
-                        shap_value=sv.shap_value,
-                        display_name=FEATURE_DISPLAY_NAMES.get(sv.feature_name, sv.feature_name),
-                    )
-                    for sv in wp.shap_values
-                ],
-                key=lambda f: abs(f.shap_value),
-                reverse=True,
-            )
+            top_shap = [
+                ShapFeature.from_raw(
+                    feature_name=name,
+                    shap_value=value,
+                    display_name=FEATURE_DISPLAY_NAMES.get(name, name),
+                )
+                for name, value in shap_by_wp.get(wp.id, ())
+            ]
 
-            base = PlayRead.model_validate(play).model_dump()
-            base['posteam_abbr'] = play.posteam_abbr
             out.append(
-                PlayWpRead(
-                    **base,
+                PlayWpRead.model_construct(
+                    **_play_fields(play),
                     home_wp=home_wp,
                     away_wp=away_wp,
                     top_shap=top_shap,
                 )
             )
         return out
+
+    async def _top_shap(self, wp_ids: list[UUID]) -> dict[UUID, list[tuple[str, float]]]:
+        """Top TOP_SHAP_N (feature_name, shap_value) per prediction by |shap|,
+        ranked and cut in SQL."""
+        if not wp_ids:
+            return {}
+        ranked = (
+            select(
+                ShapValue.wp_prediction_id,
+                ShapValue.feature_name,
+                ShapValue.shap_value,
+                func.row_number()
+                .over(
+                    partition_by=ShapValue.wp_prediction_id,
+                    order_by=func.abs(ShapValue.shap_value).desc(),
+                )
+                .label("rn"),
+            )
+            .where(ShapValue.wp_prediction_id.in_(wp_ids))
+            .subquery()
+        )
+        rows = await self._db.execute(
+            select(ranked.c.wp_prediction_id, ranked.c.feature_name, ranked.c.shap_value)
+            .where(ranked.c.rn <= TOP_SHAP_N)
+            .order_by(ranked.c.wp_prediction_id, ranked.c.rn)
+        )
+        out: dict[UUID, list[tuple[str, float]]] = {}
+        for wp_id, name, value in rows:
+            out.setdefault(wp_id, []).append((name, value))
+        return out
@@ -6,7 +6,7 @@ from datetime import datetime, timezone
 import numpy as np
 
 from app.ml.features import extract_features
-from app.ml.registry import get_current
+from app.ml.registry import get_current, get_predictor
 from app.schemas.prediction import PredictRequest, PredictResponse
 from app.schemas.shap import ShapFeature
 
@@ -34,13 +34,12 @@ class PredictionService:
         }
         features = extract_features(play_dict)
 
-        # XGBoost: predict_proba returns [[away_prob, home_prob]]
-        proba = model.predict_proba(features)[0]
-        home_wp = float(proba[1])
+        # P(home win) for the single row
+        home_wp = float(get_predictor(model)(features)[0])
         away_wp = float(1.0 - home_wp)
 
         # SHAP explanation
-        top_shap = shap_svc.explain(features, model)
+        top_shap = shap_svc.explain(features, model, version_id)
 
         # Ad-hoc /predict calls are ephemeral — replay handles DB persistence.
         return PredictResponse(
@@ -61,5 +60,5 @@ class PredictionService:
         Lower-level prediction used by ReplayService.
         Returns (home_wp, away_wp).
         """
-        proba = model.predict_proba(features)[0]
-        return float(proba[1]), float(1.0 - proba[1])
+        home = get_predictor(model)(features)[0]
+        return float(home), float(1.0 - home)
@@ -3,25 +3,27 @@ ReplayService
 
 Orchestrates a full replay session for one game:
   DeveloperReplayAdapter.stream_plays()
-    → Persist Play + PlayRaw rows
     → extract_features()
     → PredictionService.predict_raw()
-    → Persist WpPrediction
     → ShapService.explain()
-    → Persist ShapValue rows
+    → Buffer Play / PlayRaw / WpPrediction / ShapValue rows
     → SSEConnectionManager.broadcast(PlayUpdateEvent)
+    → COPY buffered rows to Postgres in batches (background writer task)
 """
 from __future__ import annotations
 
+import asyncio
+import json
 import logging
+import math
+import time
 import uuid
+from collections import defaultdict
 from datetime import datetime, timezone
 
-from app.db.base import get_session_factory
-from app.db.models.play import Play
-from app.db.models.play_raw import PlayRaw
-from app.db.models.shap_value import ShapValue
-from app.db.models.wp_prediction import WpPrediction
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.base import get_session_factory, uuid7
 from app.ml.features import extract_features
 from app.ml.registry import get_current
 from app.providers.developer_replay import DeveloperReplayAdapter
@@ -34,6 +36,94 @@ from app.utils.cache import set_latest_game_event
 
 logger = logging.getLogger(__name__)
 
+# Buffered rows are flushed once this many plays accumulate or this many
+# seconds have passed since the last flush, whichever comes first.
+FLUSH_MAX_PLAYS = 500
+FLUSH_INTERVAL_SECS = 1.0
+# Below this many rows a prepared INSERT beats COPY's per-call setup.
+COPY_MIN_ROWS = 100
+# Full buffers waiting on the writer task; bounded so a slow database holds
+# the replay back instead of piling up rows in memory.
+WRITE_QUEUE_MAX = 4
+
+_PLAY_COLUMNS = [
+    "id", "game_id", "play_number", "sequence", "quarter", "game_clock_seconds",
+    "down", "yards_to_go", "yard_line_from_own", "posteam_abbr",
+    "score_home", "score_away", "play_type", "description",
+]
+_PLAY_RAW_COLUMNS = ["id", "play_id", "provider", "payload"]
+_WP_COLUMNS = ["id", "play_id", "model_version_id", "home_wp", "away_wp"]
+_SHAP_COLUMNS = ["wp_prediction_id", "feature_name", "shap_value"]
+
+
+async def _write_rows(driver, table: str, columns: list[str], records: list[tuple]) -> None:
+    """COPY or INSERT ``records``; callers must hold a ``driver.transaction()``."""
+    if len(records) >= COPY_MIN_ROWS:
+        await driver.copy_records_to_table(table, records=records, columns=columns)
+        return
+    placeholders = ", ".join(f"${i}" for i in range(1, len(columns) + 1))
+    await driver.executemany(
+        f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({placeholders})", records
+    )
+
+
+class _RowBuffer:
+    """Accumulates replay rows and writes them in FK order in one transaction
+    (COPY for large batches)."""
+
+    def __init__(self) -> None:
+        self.plays: list[tuple] = []
+        self.play_raw: list[tuple] = []
+        self.wp_predictions: list[tuple] = []
+        self.shap_values: list[tuple] = []
+        self.last_flush = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self.plays)
+
+    def due(self) -> bool:
+        return len(self.plays) >= FLUSH_MAX_PLAYS or (
+            bool(self.plays) and time.monotonic() - self.last_flush >= FLUSH_INTERVAL_SECS
+        )
+
+    async def flush(self, db: AsyncSession) -> None:
+        if self.plays:
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            # Calls on the bare driver skip SQLAlchemy's lazy BEGIN, so without
+            # an explicit transaction every write would autocommit on its own
+            async with driver.transaction():
+                await _write_rows(driver, "plays", _PLAY_COLUMNS, self.plays)
+                await _write_rows(driver, "play_raw", _PLAY_RAW_COLUMNS, self.play_raw)
+                await _write_rows(driver, "wp_predictions", _WP_COLUMNS, self.wp_predictions)
+                if self.shap_values:
+                    await _write_rows(driver, "shap_values", _SHAP_COLUMNS, self.shap_values)
+            await db.commit()
+        self.clear()
+
+    def split(self) -> list[_RowBuffer]:
+        """One buffer per play, carrying that play's raw, WP and SHAP rows."""
+        shap_by_wp: dict[object, list[tuple]] = defaultdict(list)
+        for row in self.shap_values:
+            shap_by_wp[row[0]].append(row)
+        parts = []
+        for play, raw, wp in zip(self.plays, self.play_raw, self.wp_predictions, strict=True):
+            part = _RowBuffer()
+            part.plays.append(play)
+            part.play_raw.append(raw)
+            part.wp_predictions.append(wp)
+            part.shap_values.extend(shap_by_wp.get(wp[0], ()))
+            parts.append(part)
+        return parts
+
+    def clear(self) -> None:
+        self.plays.clear()
+        self.play_raw.clear()
+        self.wp_predictions.clear()
+        self.shap_values.clear()
+        self.last_flush = time.monotonic()
+
 
 class ReplayService:
     def __init__(
@@ -52,6 +142,9 @@ class ReplayService:
         Processes plays one at a time; each iteration yields to the event loop
         via the adapter's asyncio.sleep.
 
+        Rows are buffered (see _RowBuffer) and full buffers are handed to a
+        writer task, so neither SSE events nor the next play wait on the flush.
+
         Creates its own DB session so the session lifetime matches the task
         lifetime (not the HTTP request that spawned us).
         """
@@ -63,145 +156,199 @@ class ReplayService:
             logger.error("Cannot start replay — model not available: %s", exc)
             return
 
+        # game_id is fixed for the replay, so parse it once; a non-UUID id
+        # (e.g. a raw nflfastR id) gets one stand-in UUID for every play
+        try:
+            game_uuid = uuid.UUID(game_id)
+        except ValueError:
+            game_uuid = uuid.uuid4()
+
         factory = get_session_factory()
         play_count = 0
+        buf = _RowBuffer()
 
         async with factory() as db:
-            async for gs in self._adapter.stream_plays(game_id):
-                try:
-                    # 1. Persist Play row
-                    play_id = uuid.uuid4()
-                    play = Play(
-                        id=play_id,
-                        game_id=uuid.UUID(game_id) if len(game_id) == 36 else uuid.uuid4(),
-                        play_number=gs.get("play_number", play_count + 1),
-                        sequence=gs.get("sequence", play_count),
-                        quarter=gs.get("quarter", 1),
-                        game_clock_seconds=gs.get("game_clock_seconds", 0),
-                        down=gs.get("down"),
-                        yards_to_go=gs.get("yards_to_go"),
-                        yard_line_from_own=gs.get("yard_line_from_own"),
-                        posteam_abbr=gs.get("posteam_abbr"),
-                        score_home=gs.get("score_home", 0),
-                        score_away=gs.get("score_away", 0),
-                        play_type=gs.get("play_type"),
-                        description=gs.get("description"),
-                    )
-
-                    # 2. Persist PlayRaw row
-                    raw_payload = {k: v for k, v in gs.get("raw_payload", {}).items() if _is_json_serialisable(v)}
-                    play_raw = PlayRaw(
-                        id=uuid.uuid4(),
-                        play_id=play_id,
-                        provider="developer_replay",
-                        payload=raw_payload,
-                    )
-
-                    db.add(play)
-                    db.add(play_raw)
-                    await db.flush()  # get IDs without full commit
-
-                    # 3. Extract features
-                    features = extract_features(dict(gs))
-
-                    # 4. Predict
-                    home_wp, away_wp = await self._pred_svc.predict_raw(features, model)
-
-                    # Clamp to certainty only when the game clock has fully expired.
-                    # Do NOT clamp early (e.g. ≤10s) — the model's gradual decline is
-                    # correct and matches how ESPN/nflfastR display end-game WP.
-                    game_secs = gs.get("game_seconds_remaining") or 0
-                    score_diff = gs.get("score_differential", 0) or 0
-                    quarter = gs.get("quarter", 1) or 1
-                    # Only clamp in Q4/OT at 0:00 — quarter-end rows in Q1–Q3 also
-                    # have game_clock_seconds=0 but the game is not over.
-                    if game_secs == 0 and quarter >= 4 and score_diff != 0:
-                        if score_diff > 0:
-                            home_wp, away_wp = 1.0, 0.0
-                        else:
-                            home_wp, away_wp = 0.0, 1.0
-                        # score_diff == 0 at 0:00 Q4 → OT, don't clamp
-
-                    # 5. Persist WpPrediction
-                    wp_pred = WpPrediction(
-                        id=uuid.uuid4(),
-                        play_id=play_id,
-                        model_version_id=version_id,
-                        home_wp=home_wp,
-                        away_wp=away_wp,
-                    )
-                    db.add(wp_pred)
-                    await db.flush()
-
-                    # 6. SHAP explanation (synchronous, < 10ms)
-                    top_shap = self._shap_svc.explain(features, model, top_n=5)
-
-                    # 7. Persist ShapValues
-                    for sf in top_shap:
-                        db.add(ShapValue(
-                            id=uuid.uuid4(),
-                            wp_prediction_id=wp_pred.id,
-                            feature_name=sf.feature_name,
-                            shap_value=sf.shap_value,
-                        ))
-
-                    await db.commit()
-
-                    # 8. Build and broadcast SSE event
-                    play_read = PlayRead(
-                        id=play.id,
-                        game_id=play.game_id,
-                        play_number=play.play_number,
-                        sequence=play.sequence,
-                        quarter=play.quarter,
-                        game_clock_seconds=play.game_clock_seconds,
-                        down=play.down,
-                        yards_to_go=play.yards_to_go,
-                        yard_line_from_own=play.yard_line_from_own,
-                        score_home=play.score_home,
-                        score_away=play.score_away,
-                        play_type=play.play_type,
-                        description=play.description,
-                        posteam_abbr=gs.get("posteam_abbr"),
-                        created_at=datetime.now(tz=timezone.utc),
-                    )
-
-                    event = PlayUpdateEvent(
-                        game_id=game_id,
-                        play=play_read,
-                        home_wp=home_wp,
-                        away_wp=away_wp,
-                        top_shap=top_shap,
-                    )
-                    event_dict = event.model_dump(mode="json")
-                    await sse_manager.broadcast(game_id, event_dict)
-                    await set_latest_game_event(game_id, event_dict)
-
-                    play_count += 1
-
-                except Exception:
-                    logger.exception("Error processing play %d for game %s", play_count, game_id)
-                    await db.rollback()
-                    continue
+            # The writer owns `db` from here on; the loop below never touches it
+            queue: asyncio.Queue[_RowBuffer | None] = asyncio.Queue(maxsize=WRITE_QUEUE_MAX)
+            writer = asyncio.create_task(self._write_loop(db, queue, game_id))
+            try:
+                async for gs in self._adapter.stream_plays(game_id):
+                    try:
+                        # 1. Buffer Play row (a plain dict in _PLAY_COLUMNS
+                        #    order; it feeds COPY and the SSE event, not the ORM)
+                        play_id = uuid7()
+                        play = {
+                            "id": play_id,
+                            "game_id": game_uuid,
+                            "play_number": gs.get("play_number", play_count + 1),
+                            "sequence": gs.get("sequence", play_count),
+                            "quarter": gs.get("quarter", 1),
+                            "game_clock_seconds": gs.get("game_clock_seconds", 0),
+                            "down": gs.get("down"),
+                            "yards_to_go": gs.get("yards_to_go"),
+                            "yard_line_from_own": gs.get("yard_line_from_own"),
+                            "posteam_abbr": gs.get("posteam_abbr"),
+                            "score_home": gs.get("score_home", 0),
+                            "score_away": gs.get("score_away", 0),
+                            "play_type": gs.get("play_type"),
+                            "description": gs.get("description"),
+                        }
+
+                        # 2. Buffer PlayRaw row (JSONB is sent to COPY as text)
+                        raw_payload = {k: v for k, v in gs.get("raw_payload", {}).items() if _is_json_serialisable(v)}
+
+                        # 3. Extract features
+                        features = extract_features(dict(gs))
+
+                        # 4. Predict
+                        home_wp, away_wp = await self._pred_svc.predict_raw(features, model)
+
+                        # Clamp to certainty only when the game clock has fully expired.
+                        # Do NOT clamp early (e.g. ≤10s) — the model's gradual decline is
+                        # correct and matches how ESPN/nflfastR display end-game WP.
+                        game_secs = gs.get("game_seconds_remaining") or 0
+                        score_diff = gs.get("score_differential", 0) or 0
+                        quarter = gs.get("quarter", 1) or 1
+                        # Only clamp in Q4/OT at 0:00 — quarter-end rows in Q1–Q3 also
+                        # have game_clock_seconds=0 but the game is not over.
+                        if game_secs == 0 and quarter >= 4 and score_diff != 0:
+                            if score_diff > 0:
+                                home_wp, away_wp = 1.0, 0.0
+                            else:
+                                home_wp, away_wp = 0.0, 1.0
+                            # score_diff == 0 at 0:00 Q4 → OT, don't clamp
+
+                        # 5. Buffer WpPrediction
+                        wp_pred_id = uuid7()
+
+                        # 6. SHAP explanation (synchronous, < 10ms)
+                        top_shap = self._shap_svc.explain(features, model, version_id, top_n=5)
+
+                        # 7. Queue all rows for this play together so a flush
+                        #    never writes a child without its parent
+                        buf.plays.append(tuple(play[c] for c in _PLAY_COLUMNS))
+                        buf.play_raw.append(
+                            (uuid7(), play_id, "developer_replay", json.dumps(raw_payload))
+                        )
+                        buf.wp_predictions.append(
+                            (wp_pred_id, play_id, version_id, home_wp, away_wp)
+                        )
+                        buf.shap_values.extend(
+                            (wp_pred_id, sf.feature_name, sf.shap_value)
+                            for sf in top_shap
+                        )
+
+                        # 8. Build and broadcast SSE event (our own values, so
+                        #    no validation pass)
+                        play_read = PlayRead.model_construct(
+                            **play, created_at=datetime.now(tz=timezone.utc)
+                        )
+
+                        event = PlayUpdateEvent.model_construct(
+                            game_id=game_id,
+                            play=play_read,
+                            home_wp=home_wp,
+                            away_wp=away_wp,
+                            top_shap=top_shap,
+                        )
+                        # Serialised once for every subscriber and the snapshot,
+                        # straight to JSON by pydantic-core (no intermediate dict)
+                        payload = event.model_dump_json().encode()
+                        await sse_manager.broadcast(game_id, payload)
+                        await set_latest_game_event(game_id, payload)
+
+                        play_count += 1
+
+                    except Exception:
+                        logger.exception("Error processing play %d for game %s", play_count, game_id)
+                        continue
+
+                    if buf.due():
+                        full, buf = buf, _RowBuffer()
+                        await self._enqueue(queue, writer, full)
+            finally:
+                # Persist whatever is left, including on cancellation via /stop
+                if not writer.done():
+                    await self._enqueue(queue, writer, buf)
+                    await self._enqueue(queue, writer, None)
+                await writer
 
         # Broadcast completion
-        complete_event = ReplayCompleteEvent(game_id=game_id).model_dump(mode="json")
+        complete_event = ReplayCompleteEvent(game_id=game_id).model_dump_json().encode()
         await sse_manager.broadcast(game_id, complete_event)
         logger.info("Replay complete for game %s (%d plays processed)", game_id, play_count)
 
+    @classmethod
+    async def _write_loop(
+        cls,
+        db: AsyncSession,
+        queue: asyncio.Queue[_RowBuffer | None],
+        game_id: str,
+    ) -> None:
+        """Flush handed-off buffers in order until the None sentinel."""
+        while (buf := await queue.get()) is not None:
+            await cls._flush(db, buf, game_id)
+
+    @staticmethod
+    async def _enqueue(
+        queue: asyncio.Queue[_RowBuffer | None], writer: asyncio.Task, item: _RowBuffer | None
+    ) -> None:
+        """Hand ``item`` to the writer, failing fast if the writer has died.
+
+        A bare ``queue.put`` would block forever once the queue is full and
+        nothing is draining it.
+        """
+        put = asyncio.ensure_future(queue.put(item))
+        await asyncio.wait((put, writer), return_when=asyncio.FIRST_COMPLETED)
+        if not put.done():
+            put.cancel()
+            if not writer.cancelled():
+                writer.result()  # re-raises whatever killed the writer
+            raise RuntimeError("Replay writer exited before the replay finished")
+
+    @classmethod
+    async def _flush(cls, db: AsyncSession, buf: _RowBuffer, game_id: str) -> None:
+        n = len(buf)
+        try:
+            await buf.flush(db)
+            return
+        except Exception:
+            logger.warning(
+                "Batch write of %d plays failed for game %s; retrying play by play",
+                n, game_id, exc_info=True,
+            )
+            await cls._rollback(db, game_id)
+
+        # One bad row must not take the rest of the batch down with it
+        dropped = 0
+        for part in buf.split():
+            try:
+                await part.flush(db)
+            except Exception:
+                dropped += 1
+                logger.exception("Dropped play %s for game %s", part.plays[0][0], game_id)
+                await cls._rollback(db, game_id)
+        buf.clear()
+        if dropped:
+            logger.error("%d of %d buffered plays not persisted for game %s", dropped, n, game_id)
+
+    @staticmethod
+    async def _rollback(db: AsyncSession, game_id: str) -> None:
+        try:
+            await db.rollback()
+        except Exception:
+            logger.exception("Rollback failed for game %s", game_id)
+
+
+# Everything json.dumps accepts besides None and floats (bool is an int)
+_JSON_TYPES = (str, int, list, dict, tuple)
+
 
 def _is_json_serialisable(val) -> bool:
     """Filter out non-JSON-serialisable values from the raw payload."""
-    import math
     if val is None:
         return True
-    if isinstance(val, float) and (math.isnan(val) or math.isinf(val)):
-        return False
-    if isinstance(val, (str, int, bool, list, dict)):
-        return True
-    try:
-        import json
-        json.dumps(val)
-        return True
-    except (TypeError, ValueError):
-        return False
+    if isinstance(val, float):
+        # NaN/inf would serialise, but not as valid JSON
+        return math.isfinite(val)
+    return isinstance(val, _JSON_TYPES)
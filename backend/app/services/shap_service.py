@@ -1,59 +1,117 @@
 from __future__ import annotations
 
 import logging
+import uuid
 
 import numpy as np
 import shap
+import xgboost
 
+from app.config import get_settings
 from app.ml.features import FEATURE_COLS, FEATURE_DISPLAY_NAMES
 from app.ml.registry import get_xgb_model
 from app.schemas.shap import ShapFeature
 
 logger = logging.getLogger(__name__)
 
-# Cache the SHAP explainer since building it from the booster takes ~100ms
-_explainer_cache: dict[int, shap.TreeExplainer] = {}
+# SHAP backends keyed by model version. Building a TreeExplainer takes ~100ms,
+# so it's done once per version; only the current version is kept, so a model
+# reload drops the previous entry instead of leaking it.
+_explainer_cache: dict[uuid.UUID, shap.TreeExplainer] = {}
+# CUDA copies of boosters for SHAP_DEVICE=cuda
+_gpu_booster_cache: dict[uuid.UUID, xgboost.Booster] = {}
 
+_DISPLAY_NAMES = [FEATURE_DISPLAY_NAMES.get(col, col) for col in FEATURE_COLS]
 
-def _get_explainer(model) -> shap.TreeExplainer:
+
+def _use_gpu() -> bool:
+    return get_settings().shap_device.lower() == "cuda"
+
+
+def _build(version_id: uuid.UUID, model) -> None:
     # Unwrap CalibratedClassifierCV to get the raw XGBoost model for Tree SHAP
     xgb = get_xgb_model(model)
-    key = id(xgb)
-    if key not in _explainer_cache:
-        logger.info("Building SHAP TreeExplainer (first call, then cached)...")
-        _explainer_cache[key] = shap.TreeExplainer(xgb)
-    return _explainer_cache[key]
+    if _use_gpu():
+        # A copy, so predict_proba on the shared model stays on the CPU
+        logger.info("Copying booster for model %s to CUDA for SHAP...", version_id)
+        booster = xgb.get_booster().copy()
+        booster.set_param({"device": "cuda"})
+        _gpu_booster_cache.clear()
+        _gpu_booster_cache[version_id] = booster
+    else:
+        logger.info("Building SHAP TreeExplainer for model %s...", version_id)
+        explainer = shap.TreeExplainer(xgb)
+        _explainer_cache.clear()
+        _explainer_cache[version_id] = explainer
+
+
+def _shap_matrix(features: np.ndarray, model, version_id: uuid.UUID) -> np.ndarray:
+    """(N, 10) SHAP values in log-odds space."""
+    if _use_gpu():
+        if version_id not in _gpu_booster_cache:
+            _build(version_id, model)
+        # pred_contribs runs GPUTreeShap on a CUDA booster (trees must be at
+        # most 32 deep; training uses max_depth=5). Output is (N, 11) with
+        # the bias term last.
+        booster = _gpu_booster_cache[version_id]
+        dmat = xgboost.DMatrix(features, feature_names=booster.feature_names)
+        return booster.predict(dmat, pred_contribs=True)[:, :-1]
+
+    if version_id not in _explainer_cache:
+        _build(version_id, model)
+    explainer = _explainer_cache[version_id]
+
+    # shap_values returns shape (N, 10) for binary XGBoost (log-odds space)
+    sv = explainer.shap_values(features)
+    # Older shap versions return list of arrays for binary classification.
+    # asarray (unlike np.array) doesn't copy the ndarray newer versions return.
+    return np.asarray(sv[1] if isinstance(sv, list) else sv)
 
 
 class ShapService:
+    @staticmethod
+    def prebuild(version_id: uuid.UUID, model) -> None:
+        """Build the SHAP backend for a model version ahead of its first play."""
+        _build(version_id, model)
+
     def explain(
         self,
         features: np.ndarray,
         model,
+        version_id: uuid.UUID,
         top_n: int = 5,
     ) -> list[ShapFeature]:
         """
         Compute SHAP values for a (1, 10) feature array.
         Returns top_n features sorted by absolute SHAP value descending.
         """
-        explainer = _get_explainer(model)
-
-        # shap_values returns shape (1, 10) for binary XGBoost (log-odds space)
-        sv = explainer.shap_values(features)
-        if isinstance(sv, list):
-            # Older shap versions return list of arrays for binary classification
-            sv = sv[1]
-        sv = np.array(sv).flatten()  # shape (10,)
-
-        results: list[ShapFeature] = []
-        for i, col in enumerate(FEATURE_COLS):
-            results.append(
+        return self.explain_batch(features, model, version_id, top_n=top_n)[0]
+
+    def explain_batch(
+        self,
+        features: np.ndarray,
+        model,
+        version_id: uuid.UUID,
+        top_n: int = 5,
+    ) -> list[list[ShapFeature]]:
+        """
+        Compute SHAP values for an (N, 10) feature array in one explainer call.
+        Returns one top_n list per row, in row order (same ranking as explain).
+        """
+        sv = _shap_matrix(features, model, version_id).reshape(-1, len(FEATURE_COLS))  # shape (N, 10)
+
+        # Rank columns per row by |SHAP| and keep only the top_n; the sort is
+        # stable so ties (unused features sit at exactly 0) stay in column order
+        top = np.argsort(-np.abs(sv), axis=1, kind="stable")[:, :top_n]
+        values = np.take_along_axis(sv, top, axis=1)
+        return [
+            [
                 ShapFeature.from_raw(
-                    feature_name=col,
-                    shap_value=float(sv[i]),
-                    display_name=FEATURE_DISPLAY_NAMES.get(col, col),
+                    feature_name=FEATURE_COLS[i],
+                    shap_value=value,
+                    display_name=_DISPLAY_NAMES[i],
                 )
-            )
-
-        results.sort(key=lambda f: abs(f.shap_value), reverse=True)
-        return results[:top_n]
+                for i, value in zip(row_idx, row_values)
+            ]
+            for row_idx, row_values in zip(top.tolist(), values.tolist())
+        ]
@@ -2,6 +2,7 @@
 SSE Connection Manager.
 
 Maintains one asyncio.Queue per connected browser tab per game.
+Events are queued as JSON bytes, serialised once by the broadcaster.
 The module-level singleton `sse_manager` is shared between:
   - app/api/stream.py  (subscribes/unsubscribes clients)
   - app/services/replay_service.py  (broadcasts events)
@@ -14,35 +15,49 @@ from collections import defaultdict
 
 logger = logging.getLogger(__name__)
 
+# Per-subscriber backlog; a slow client loses its oldest events beyond this
+QUEUE_MAXSIZE = 256
+
 
 class SSEConnectionManager:
     def __init__(self) -> None:
-        # game_id → list of asyncio.Queue
-        self._queues: dict[str, list[asyncio.Queue]] = defaultdict(list)
+        # game_id → set of asyncio.Queue (O(1) unsubscribe)
+        self._queues: dict[str, set[asyncio.Queue]] = defaultdict(set)
 
     async def subscribe(self, game_id: str) -> asyncio.Queue:
-        q: asyncio.Queue = asyncio.Queue(maxsize=200)
-        self._queues[game_id].append(q)
-        logger.debug("SSE subscriber added for game %s (total: %d)", game_id, len(self._queues[game_id]))
+        q: asyncio.Queue = asyncio.Queue(maxsize=QUEUE_MAXSIZE)
+        self._queues[game_id].add(q)
+        # Guarded so the count isn't computed when DEBUG is off
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SSE subscriber added for game %s (total: %d)", game_id, len(self._queues[game_id]))
         return q
 
     async def unsubscribe(self, game_id: str, q: asyncio.Queue) -> None:
-        try:
-            self._queues[game_id].remove(q)
-            logger.debug("SSE subscriber removed for game %s (remaining: %d)", game_id, len(self._queues[game_id]))
-        except ValueError:
-            pass  # Already removed
-
-    async def broadcast(self, game_id: str, event: dict) -> None:
-        queues = list(self._queues.get(game_id, []))
-        for q in queues:
+        queues = self._queues.get(game_id)
+        if queues is None:
+            return  # Already removed
+        queues.discard(q)
+        if not queues:
+            # Last subscriber gone; don't keep an empty entry per finished game
+            del self._queues[game_id]
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("SSE subscriber removed for game %s (remaining: %d)", game_id, len(queues))
+
+    async def broadcast(self, game_id: str, event: bytes) -> None:
+        """Queue one JSON-encoded event for every subscriber of the game."""
+        # No await inside the loop, so (un)subscribes can't interleave with
+        # it and the set is iterated without a snapshot copy
+        for q in self._queues.get(game_id, ()):
             try:
                 q.put_nowait(event)
             except asyncio.QueueFull:
-                logger.warning("SSE queue full for game %s — dropping event", game_id)
+                # Drop the oldest event — clients care about the latest state
+                logger.warning("SSE queue full for game %s — dropping oldest event", game_id)
+                q.get_nowait()
+                q.put_nowait(event)
 
     def subscriber_count(self, game_id: str) -> int:
-        return len(self._queues.get(game_id, []))
+        return len(self._queues.get(game_id, ()))
 
 
 # Module-level singleton
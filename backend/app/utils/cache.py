@@ -1,12 +1,11 @@
 from __future__ import annotations
 
-import json
-
 import redis.asyncio as aioredis
 
 _redis: aioredis.Redis | None = None
 
 LATEST_EVENT_TTL = 3600  # 1 hour
+ANALYTICS_TTL = 3600
 
 
 def init_cache(redis_client: aioredis.Redis) -> None:
@@ -18,13 +17,31 @@ def _key(game_id: str) -> str:
     return f"game:{game_id}:latest"
 
 
-async def set_latest_game_event(game_id: str, event: dict) -> None:
+async def set_latest_game_event(game_id: str, payload: bytes) -> None:
+    """Store an already-serialised event (the same bytes SSE clients get)."""
     if _redis is None:
         return
-    await _redis.set(_key(game_id), json.dumps(event), ex=LATEST_EVENT_TTL)
+    await _redis.set(_key(game_id), payload, ex=LATEST_EVENT_TTL)
 
 
-async def get_latest_game_event(game_id: str) -> str | None:
+async def get_latest_game_event(game_id: str) -> bytes | None:
+    """Raw JSON bytes of the latest event (the client doesn't decode replies)."""
     if _redis is None:
         return None
     return await _redis.get(_key(game_id))
+
+
+def cache_enabled() -> bool:
+    return _redis is not None
+
+
+async def get_analytics_result(key: str) -> bytes | None:
+    if _redis is None:
+        return None
+    return await _redis.get(f"analytics:{key}")
+
+
+async def set_analytics_result(key: str, payload: bytes) -> None:
+    if _redis is None:
+        return
+    await _redis.set(f"analytics:{key}", payload, ex=ANALYTICS_TTL)
@@ -0,0 +1,22 @@
+"""Shared helpers for reading the multi-GB nflfastR play-by-play CSVs."""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from pathlib import Path
+
+import pandas as pd
+
+# pyarrow's multithreaded CSV parser is much faster on the PBP files; it's
+# optional, so fall back to the default C engine when it isn't installed.
+try:
+    import pyarrow  # noqa: F401
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+CSV_ENGINE = "pyarrow" if HAS_PYARROW else "c"
+
+
+def present_columns(csv_path: Path, wanted: Iterable[str]) -> list[str]:
+    """The subset of `wanted` that exists in the CSV header (order preserved)."""
+    header = set(pd.read_csv(csv_path, nrows=0).columns)
+    return [c for c in wanted if c in header]
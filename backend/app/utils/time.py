@@ -1,14 +1,26 @@
 from __future__ import annotations
 
+# Every quarter clock reading (0..15:00), formatted once at import
+_QUARTER_SECONDS = 900
+_CLOCK_STRS = tuple(f"{s // 60:02d}:{s % 60:02d}" for s in range(_QUARTER_SECONDS + 1))
+_CLOCK_SECS = {clock: s for s, clock in enumerate(_CLOCK_STRS)}
+
 
 def seconds_to_game_clock(seconds: int) -> str:
     """Convert seconds remaining in a quarter to MM:SS display string."""
-    minutes, secs = divmod(max(0, seconds), 60)
+    seconds = max(0, seconds)
+    if seconds <= _QUARTER_SECONDS:
+        return _CLOCK_STRS[seconds]
+    minutes, secs = divmod(seconds, 60)
     return f"{minutes:02d}:{secs:02d}"
 
 
 def game_clock_to_seconds(clock_str: str) -> int:
     """Convert 'MM:SS' game clock string to seconds integer."""
+    seconds = _CLOCK_SECS.get(clock_str)
+    if seconds is not None:
+        return seconds
+    # Unpadded, out-of-range or malformed readings
     parts = clock_str.split(":")
     if len(parts) != 2:
         return 0
@@ -17,6 +17,19 @@ from app.workers.celery_app import celery_app
 
 logger = logging.getLogger(__name__)
 
+# One event loop per worker process, reused by every task. The shared engine's
+# asyncpg connections belong to the loop that opened them, so a fresh
+# asyncio.run() per task would strand the pool.
+_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _run(coro):
+    global _loop
+    if _loop is None or _loop.is_closed():
+        _loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(_loop)
+    return _loop.run_until_complete(coro)
+
 
 @celery_app.task(bind=True, name="compute_shap_async")
 def compute_shap_async(self, wp_prediction_id: str) -> dict:
@@ -25,7 +38,7 @@ def compute_shap_async(self, wp_prediction_id: str) -> dict:
     Called asynchronously by Celery workers in live mode.
     """
     try:
-        result = asyncio.run(_compute_and_persist(uuid.UUID(wp_prediction_id)))
+        result = _run(_compute_and_persist(uuid.UUID(wp_prediction_id)))
         return {"status": "ok", "wp_prediction_id": wp_prediction_id, **result}
     except Exception as exc:
         logger.exception("SHAP task failed for %s", wp_prediction_id)
@@ -34,18 +47,19 @@ def compute_shap_async(self, wp_prediction_id: str) -> dict:
 
 async def _compute_and_persist(wp_prediction_id: uuid.UUID) -> dict:
     from sqlalchemy import select
-    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    from sqlalchemy.dialects.postgresql import insert as pg_insert
 
     from app.config import get_settings
+    from app.db.base import ensure_db
     from app.db.models.shap_value import ShapValue
     from app.db.models.wp_prediction import WpPrediction
     from app.ml.features import FEATURE_COLS, extract_features
     from app.ml.registry import get_current
     from app.services.shap_service import ShapService
 
-    settings = get_settings()
-    engine = create_async_engine(settings.database_url)
-    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    # Engine and pool are built on the worker's first task and kept; the
+    # registry's model lookup picks up the same factory
+    factory = ensure_db(get_settings().database_url)
 
     async with factory() as session:
         wp_pred = (
@@ -79,20 +93,26 @@ async def _compute_and_persist(wp_prediction_id: uuid.UUID) -> dict:
             "spread_line": 0.0,
         }
         features = extract_features(play_dict)
-        model, _, _ = await get_current()
+        model, version_id, _ = await get_current()
         shap_svc = ShapService()
-        shap_features = shap_svc.explain(features, model, top_n=len(FEATURE_COLS))
-
-        # Persist all SHAP values
-        for sf in shap_features:
-            sv = ShapValue(
-                id=uuid.uuid4(),
-                wp_prediction_id=wp_prediction_id,
-                feature_name=sf.feature_name,
-                shap_value=sf.shap_value,
+        shap_features = shap_svc.explain(features, model, version_id, top_n=len(FEATURE_COLS))
+
+        # Persist all SHAP values; the replay may already have stored the
+        # top few for this prediction, so upsert on the natural key.
+        stmt = pg_insert(ShapValue).values([
+            {
+                "wp_prediction_id": wp_prediction_id,
+                "feature_name": sf.feature_name,
+                "shap_value": sf.shap_value,
+            }
+            for sf in shap_features
+        ])
+        await session.execute(
+            stmt.on_conflict_do_update(
+                index_elements=["wp_prediction_id", "feature_name"],
+                set_={"shap_value": stmt.excluded.shap_value},
             )
-            session.add(sv)
+        )
         await session.commit()
 
-    await engine.dispose()
     return {"shap_values_count": len(shap_features)}
@@ -18,23 +18,22 @@ from app.db.models.play import Play
 from app.db.models.game import Game
 from app.db.models.team import Team
 
-CLOCK_PREFIX = re.compile(r'^\(\d+:\d+\)\s*(?:\([\w\s]+\)\s*)?')
-TIMEOUT_RE   = re.compile(r'Timeout #\d+ by (\w+)')
-ABBR_RE      = re.compile(r'^([A-Z]{2,3})\b')
+# One anchored pass: a timeout's team, else the first 2-3 letter capitalised
+# token after the optional clock "(MM:SS) " and formation "(Shotgun) " prefixes.
+# Equivalent to matching the timeout form, then stripping the prefix and
+# matching the token, without building the stripped substring.
+ABBR_RE = re.compile(
+    r'^(?:Timeout #\d+ by (\w+)'
+    r'|(?:\(\d+:\d+\)\s*(?:\([\w\s]+\)\s*)?)?\s*([A-Z]{2,3})\b)'
+)
 
 
 def _extract_abbr(description: str | None) -> str | None:
     if not description:
         return None
-    # Timeout play
-    m = TIMEOUT_RE.match(description)
+    m = ABBR_RE.match(description)
     if m:
-        return m.group(1)
-    # Strip leading clock "(MM:SS) " and optional formation "(Shotgun) "
-    stripped = CLOCK_PREFIX.sub('', description).strip()
-    m = ABBR_RE.match(stripped)
-    if m:
-        return m.group(1)
+        return m.group(1) or m.group(2)
     return None
 
 
@@ -44,22 +43,38 @@ async def main() -> None:
     factory = get_session_factory()
 
     async with factory() as db:
-        # Load all plays that don't yet have posteam_abbr set
+        # Load id + description of plays that don't yet have posteam_abbr set
+        # (plain rows; nothing is tracked by the ORM)
         result = await db.execute(
-            select(Play).where(Play.posteam_abbr.is_(None))
+            select(Play.id, Play.description).where(Play.posteam_abbr.is_(None))
         )
-        plays = result.scalars().all()
-        print(f"Found {len(plays)} plays missing posteam_abbr")
+        rows = result.all()
+        print(f"Found {len(rows)} plays missing posteam_abbr")
 
-        updated = 0
-        for play in plays:
-            abbr = _extract_abbr(play.description)
-            if abbr:
-                play.posteam_abbr = abbr
-                updated += 1
+        updates = [
+            (play_id, abbr)
+            for play_id, description in rows
+            if (abbr := _extract_abbr(description))
+        ]
 
+        # COPY the extracted values into a temp table and apply them with a
+        # single UPDATE ... FROM join
+        if updates:
+            conn = await db.connection()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            await driver.execute(
+                "CREATE TEMP TABLE tmp_posteam (id uuid, posteam_abbr text) ON COMMIT DROP"
+            )
+            await driver.copy_records_to_table(
+                "tmp_posteam", records=updates, columns=["id", "posteam_abbr"]
+            )
+            await driver.execute(
+                "UPDATE plays SET posteam_abbr = t.posteam_abbr "
+                "FROM tmp_posteam t WHERE plays.id = t.id"
+            )
         await db.commit()
-        print(f"Backfilled {updated} plays")
+        print(f"Backfilled {len(updates)} plays")
 
         # Spot-check
         result2 = await db.execute(
@@ -0,0 +1,194 @@
+import asyncio
+from collections import defaultdict
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.services.replay_service import ReplayService, _RowBuffer
+
+
+class _FakeDriver:
+    """Stands in for the asyncpg connection.
+
+    Like the real driver, writes autocommit unless made inside
+    ``transaction()``, and primary keys are enforced.
+    """
+
+    def __init__(self) -> None:
+        self.committed: dict[str, list[tuple]] = defaultdict(list)
+        self._tx: dict[str, list[tuple]] | None = None
+        self.held = asyncio.Event()
+
+    @asynccontextmanager
+    async def transaction(self):
+        self._tx = defaultdict(list)
+        try:
+            yield
+            for table, records in self._tx.items():
+                self.committed[table].extend(records)
+        finally:
+            self._tx = None
+
+    async def executemany(self, sql: str, records: list[tuple]) -> None:
+        await self._write(sql.split()[2], records)
+
+    async def copy_records_to_table(self, table: str, records: list[tuple], columns: list[str]) -> None:
+        await self._write(table, records)
+
+    async def _write(self, table: str, records: list[tuple]) -> None:
+        if any("HOLD" in record for record in records):
+            self.held.set()
+            await asyncio.Future()  # stalls until cancelled
+        if any("BAD" in record for record in records):
+            raise ValueError(f"bad row in {table}")
+        staged = self._tx[table] if self._tx is not None else []
+        seen = {_pk(table, row) for row in self.committed[table] + staged}
+        for record in records:
+            if _pk(table, record) in seen:
+                raise ValueError(f"duplicate key in {table}")
+            seen.add(_pk(table, record))
+        if self._tx is None:
+            self.committed[table].extend(records)
+        else:
+            staged.extend(records)
+
+
+def _pk(table: str, record: tuple) -> tuple:
+    return record[:2] if table == "shap_values" else record[:1]
+
+
+class _FakeSession:
+    """SQLAlchemy's asyncpg adapter never issued BEGIN for the raw driver
+    calls, so commit and rollback leave the driver's rows alone."""
+
+    def __init__(self, rollback_fails: bool = False) -> None:
+        self.driver = _FakeDriver()
+        self.rollback_fails = rollback_fails
+
+    async def connection(self):
+        return self
+
+    async def get_raw_connection(self):
+        return self
+
+    @property
+    def driver_connection(self) -> _FakeDriver:
+        return self.driver
+
+    async def commit(self) -> None:
+        pass
+
+    async def rollback(self) -> None:
+        if self.rollback_fails:
+            raise ConnectionError("connection lost")
+
+
+def _buffer(
+    n_plays: int,
+    bad: int | None = None,
+    bad_table: str = "play_raw",
+    mark: str = "BAD",
+    first: int = 0,
+) -> _RowBuffer:
+    buf = _RowBuffer()
+    for i in range(first, first + n_plays):
+        play_id, wp_id = f"play-{i}", f"wp-{i}"
+        marker = mark if i == bad else None
+        buf.plays.append((play_id, "game", i))
+        buf.play_raw.append(
+            (f"raw-{i}", play_id, "nflfastr", marker if bad_table == "play_raw" and marker else "{}")
+        )
+        buf.wp_predictions.append(
+            (wp_id, play_id, marker if bad_table == "wp_predictions" and marker else "model", 0.5, 0.5)
+        )
+        buf.shap_values.extend((wp_id, feature, 0.1) for feature in ("down", "ydstogo"))
+    return buf
+
+
+def _play_ids(rows: list[tuple], column: int = 0) -> list[str]:
+    return sorted(row[column] for row in rows)
+
+
+async def test_flush_survives_failing_rollback():
+    db = _FakeSession(rollback_fails=True)
+    buf = _buffer(3, bad=1)
+
+    await ReplayService._flush(db, buf, "game")
+
+    assert len(buf) == 0
+
+
+async def test_enqueue_raises_when_writer_has_died():
+    async def dead_writer():
+        raise RuntimeError("writer crashed")
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    queue.put_nowait(_RowBuffer())
+    writer = asyncio.create_task(dead_writer())
+
+    with pytest.raises(RuntimeError, match="writer crashed"):
+        await asyncio.wait_for(ReplayService._enqueue(queue, writer, _RowBuffer()), timeout=1)
+
+
+async def test_writer_dying_mid_flush_keeps_only_whole_batches():
+    db = _FakeSession()
+    queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+    writer = asyncio.create_task(ReplayService._write_loop(db, queue, "game"))
+
+    await ReplayService._enqueue(queue, writer, _buffer(3))
+    stalled = _buffer(3, first=3, bad=4, bad_table="wp_predictions", mark="HOLD")
+    await ReplayService._enqueue(queue, writer, stalled)
+    await db.driver.held.wait()
+    await ReplayService._enqueue(queue, writer, _buffer(3, first=6))
+    writer.cancel()
+
+    with pytest.raises(RuntimeError, match="exited before"):
+        await asyncio.wait_for(ReplayService._enqueue(queue, writer, None), timeout=1)
+
+    committed = db.driver.committed
+    kept = [f"play-{i}" for i in range(3)]
+    assert _play_ids(committed["plays"]) == kept
+    assert _play_ids(committed["play_raw"], column=1) == kept
+    assert _play_ids(committed["wp_predictions"], column=1) == kept
+    assert len(committed["shap_values"]) == 6
+
+
+async def test_flush_drops_only_the_bad_play():
+    db = _FakeSession()
+    buf = _buffer(5, bad=2)
+
+    await ReplayService._flush(db, buf, "game")
+
+    committed = db.driver.committed
+    kept = [f"play-{i}" for i in (0, 1, 3, 4)]
+    assert [row[0] for row in committed["plays"]] == kept
+    assert [row[1] for row in committed["play_raw"]] == kept
+    assert [row[1] for row in committed["wp_predictions"]] == kept
+    assert sorted({row[0] for row in committed["shap_values"]}) == [f"wp-{i}" for i in (0, 1, 3, 4)]
+    assert len(committed["shap_values"]) == 8
+    assert len(buf) == 0
+
+
+async def test_flush_writes_large_batch_in_one_go():
+    db = _FakeSession()
+
+    await ReplayService._flush(db, _buffer(150), "game")
+
+    assert len(db.driver.committed["plays"]) == 150
+    assert len(db.driver.committed["shap_values"]) == 300
+
+
+# Below and above COPY_MIN_ROWS: prepared INSERTs and COPY
+@pytest.mark.parametrize("n_plays", [20, 150])
+async def test_failed_wp_write_leaves_no_orphan_plays(n_plays):
+    db = _FakeSession()
+    buf = _buffer(n_plays, bad=7, bad_table="wp_predictions")
+
+    await ReplayService._flush(db, buf, "game")
+
+    committed = db.driver.committed
+    kept = sorted(f"play-{i}" for i in range(n_plays) if i != 7)
+    assert _play_ids(committed["plays"]) == kept
+    assert _play_ids(committed["play_raw"], column=1) == kept
+    assert _play_ids(committed["wp_predictions"], column=1) == kept
+    assert len(committed["shap_values"]) == 2 * (n_plays - 1)
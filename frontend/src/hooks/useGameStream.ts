@@ -52,10 +52,15 @@ export function useGameStream(
 
     source.onmessage = (e: MessageEvent) => {
       try {
-        const event: SSEEvent = JSON.parse(e.data as string)
-        dispatch({ type: 'SSE_EVENT', payload: event })
-        if (event.event_type === 'replay_complete') {
-          source.close()
+        // Live frames carry a batch (array) of events; the cached snapshot
+        // sent on connect is a single event object.
+        const data: SSEEvent | SSEEvent[] = JSON.parse(e.data as string)
+        const events = Array.isArray(data) ? data : [data]
+        for (const event of events) {
+          dispatch({ type: 'SSE_EVENT', payload: event })
+          if (event.event_type === 'replay_complete') {
+            source.close()
+          }
         }
       } catch {
         // Ignore heartbeat comments or malformed events